@@ -0,0 +1,45 @@
+"""
+Shared pytest fixtures for the Soko-Mushi test suite.
+"""
+
+import os
+import sys
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def available_drives():
+    """Drive list, probed once per test session.
+
+    Enumerating drives parses /proc/mounts on Linux and walks the logical
+    drive letters on Windows — kernel round-trips worth paying once, not
+    per test.
+    """
+    from soko_mushi.core import DiskAnalyzer
+    return DiskAnalyzer.get_available_drives()
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Session-wide QApplication for GUI-touching tests.
+
+    Qt's platform plugin load, fontconfig scan, and stylesheet parse run
+    exactly once per session; every GUI test shares the instance. Skips
+    the requesting test when PyQt6 is absent or a display-backed platform
+    is forced on a machine without a display.
+    """
+    QtWidgets = pytest.importorskip("PyQt6.QtWidgets",
+                                    reason="PyQt6 not installed")
+
+    platform = os.environ.get("QT_QPA_PLATFORM", "offscreen")
+    if (sys.platform.startswith("linux")
+            and platform not in ("offscreen", "minimal")
+            and not os.environ.get("DISPLAY")):
+        pytest.skip(f"no display for Qt platform {platform!r}")
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    # An empty argv keeps Qt from scanning pytest's own flags for
+    # -style/-platform options it would warn about.
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    yield app
@@ -3,15 +3,36 @@
 Build script for compiling Soko-Mushi with Nuitka.
 """
 
+import hashlib
 import os
+import plistlib
 import sys
 import subprocess
 import shutil
 from pathlib import Path
 
 
-def build_executable():
-    """Build the executable using Nuitka."""
+def _build_cache_key(cmd):
+    """Hash the build inputs: source tree, command line, and interpreter.
+
+    A matching key means a previous build already produced the identical
+    artifact, so Nuitka can be skipped entirely.
+    """
+    digest = hashlib.sha256()
+    digest.update(' '.join(cmd).encode('utf-8'))
+    digest.update(sys.version.encode('utf-8'))
+    digest.update(sys.platform.encode('utf-8'))
+    for source in sorted(Path('soko_mushi').rglob('*.py')):
+        digest.update(str(source).encode('utf-8'))
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def build_executable(mode: str = "app"):
+    """Build the executable using Nuitka.
+
+    mode is either "app" (default bundle) or "onefile" (single executable).
+    """
     
     # Determine the platform
     if sys.platform.startswith('win'):
@@ -27,11 +48,27 @@ def build_executable():
     # Build command
     cmd = [
         sys.executable, '-m', 'nuitka',
-        '--mode=app',
+        f'--mode={mode}',
         '--enable-plugin=pyside6',
+        '--enable-plugin=anti-bloat',
+        '--lto=yes',
+        f'--jobs={os.cpu_count()}',
+        '--python-flag=no_site',
+        '--python-flag=no_warnings',
+        '--python-flag=no_docstrings',
+        '--python-flag=no_asserts',
+        '--noinclude-qt-translations',
+        '--noinclude-qt-plugins=mediaservice,sensors,webengine',
         '--output-filename=soko-mushi' + exe_extension,
         '--output-dir=dist',
 #        '--include-data-dir=src/soko_mushi=soko_mushi',
+        '--nofollow-import-to=psutil',
+        '--nofollow-import-to=pytest',
+        '--nofollow-import-to=setuptools',
+        '--nofollow-import-to=unittest',
+        '--nofollow-import-to=tkinter',
+        '--nofollow-import-to=PySide6.QtWebEngineCore',
+        '--nofollow-import-to=PySide6.QtMultimedia',
         '--product-name=Soko-Mushi',
         '--product-version=1.0.0',
         '--file-description=Local Disk Analysis Tool',
@@ -50,7 +87,6 @@ def build_executable():
     if platform == 'macos':
         cmd.extend([
             '--static-libpython=no',
-            '--mode=app',
             '--macos-app-icon=../assets/icon.icns' if Path('../assets/icon.icns').exists() else ''
         ])
 
@@ -62,18 +98,52 @@ def build_executable():
     print(f"Command: {' '.join(cmd)}")
     print()
     
-    # Clean previous build
+    # Remove only the final artifacts; keeping the rest of dist/ lets Nuitka
+    # (and ccache underneath it) reuse intermediate C compilation results.
+    # The macOS app bundle is named main.app, so the glob alone misses it.
     if Path('dist').exists():
-        print("Cleaning previous build...")
-        shutil.rmtree('dist')
-    
+        old_artifacts = list(Path('dist').glob('soko-mushi*'))
+        old_artifacts.extend(Path('dist').glob('main.app'))
+        for old_artifact in old_artifacts:
+            print(f"Removing previous artifact: {old_artifact}")
+            if old_artifact.is_dir():
+                shutil.rmtree(old_artifact)
+            else:
+                old_artifact.unlink()
+
+    # Persistent cache location for Nuitka's ccache/dependency downloads
+    os.environ.setdefault(
+        'NUITKA_CACHE_DIR',
+        str(Path.home() / '.cache' / 'nuitka')
+    )
+    cmd.append('--assume-yes-for-downloads')
+
+    # Content-addressed build cache: identical inputs reuse the previous
+    # artifact instead of invoking Nuitka again. Only macOS app-mode builds
+    # produce the main.app bundle; onefile builds emit the plain executable.
+    if platform == 'macos' and mode == 'app':
+        artifact_name = 'main.app'
+    else:
+        artifact_name = f"soko-mushi{exe_extension}"
+    cache_dir = Path.home() / '.cache' / 'soko-mushi-build' / _build_cache_key(cmd)
+    cached_artifact = cache_dir / artifact_name
+
+    if cached_artifact.exists():
+        print(f"Reusing cached build: {cached_artifact}")
+        Path('dist').mkdir(exist_ok=True)
+        if cached_artifact.is_dir():
+            shutil.copytree(cached_artifact, Path('dist') / artifact_name)
+        else:
+            shutil.copy2(cached_artifact, Path('dist') / artifact_name)
+        return
+
     # Run Nuitka
     try:
         result = subprocess.run(cmd, check=True)
         print("\n✅ Build completed successfully!")
         
         # Show output location
-        if platform == 'macos':
+        if artifact_name == 'main.app':
             # Nuitka --mode=app creates a .app bundle
             app_bundle = Path('dist') / 'main.app'
             icon_src = Path('../assets/icon.icns')
@@ -89,17 +159,11 @@ def build_executable():
                 # Update Info.plist to reference icon.icns
                 plist_path = app_bundle / 'Contents' / 'Info.plist'
                 if plist_path.exists():
-                    with open(plist_path, 'r', encoding='utf-8') as f:
-                        plist_data = f.read()
-                    import re
-                    # Replace or add CFBundleIconFile
-                    if '<key>CFBundleIconFile</key>' in plist_data:
-                        plist_data = re.sub(r'<key>CFBundleIconFile</key>\s*<string>.*?</string>', '<key>CFBundleIconFile</key>\n    <string>icon.icns</string>', plist_data)
-                    else:
-                        # Insert before </dict>
-                        plist_data = plist_data.replace('</dict>', '    <key>CFBundleIconFile</key>\n    <string>icon.icns</string>\n</dict>')
-                    with open(plist_path, 'w', encoding='utf-8') as f:
-                        f.write(plist_data)
+                    with open(plist_path, 'rb') as f:
+                        plist_data = plistlib.load(f)
+                    plist_data['CFBundleIconFile'] = 'icon.icns'
+                    with open(plist_path, 'wb') as f:
+                        plistlib.dump(plist_data, f)
                     print(f"Updated Info.plist to reference icon.icns")
                 else:
                     print("Info.plist not found in app bundle!")
@@ -112,7 +176,17 @@ def build_executable():
                 print(f"\U0001F4CF File size: {exe_path.stat().st_size / 1024 / 1024:.1f} MB")
             else:
                 print("\u274C Executable not found in expected location")
-            
+
+        # Archive the fresh artifact into the content-addressed cache
+        built_artifact = Path('dist') / artifact_name
+        if built_artifact.exists():
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            if built_artifact.is_dir():
+                shutil.copytree(built_artifact, cached_artifact, dirs_exist_ok=True)
+            else:
+                shutil.copy2(built_artifact, cached_artifact)
+            print(f"Archived build to cache: {cached_artifact}")
+
     except subprocess.CalledProcessError as e:
         print(f"❌ Build failed with exit code {e.returncode}")
         sys.exit(1)
@@ -145,10 +219,16 @@ if __name__ == "__main__":
     
     parser = argparse.ArgumentParser(description="Build Soko-Mushi executable")
     parser.add_argument("--installer", action="store_true", help="Show installer creation info")
+    parser.add_argument(
+        "--mode",
+        choices=("app", "onefile"),
+        default="app",
+        help="Build an app bundle (default) or a single onefile executable"
+    )
     
     args = parser.parse_args()
     
     if args.installer:
         build_installer()
     else:
-        build_executable()
+        build_executable(args.mode)
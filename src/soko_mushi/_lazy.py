@@ -0,0 +1,35 @@
+"""
+Lazy module loading for Soko-Mushi.
+"""
+
+import importlib
+
+
+class _LazyModule:
+    """Proxy that defers importing a module until first attribute access.
+
+    Holding one of these costs nothing; the real import (and everything it
+    pulls in transitively) happens only if an attribute is actually read.
+    """
+
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        module = self._module
+        if module is None:
+            module = importlib.import_module(self._name)
+            self._module = module
+        return getattr(module, attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "unloaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name: str) -> _LazyModule:
+    """Return a proxy for ``name`` that imports it on first attribute access."""
+    return _LazyModule(name)
@@ -3,28 +3,198 @@ Core disk analysis functionality for Soko-Mushi.
 """
 
 import os
+import stat as stat_module
+import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from dataclasses import dataclass
 from typing import Dict, List, Optional, Callable, Any
+import heapq
 import time
-import psutil
+from operator import attrgetter
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Bucket label for files without an extension. A single shared string means
+# the stats dict lookup for such files always hits pointer equality, like
+# the interned extensions do.
+_NO_EXTENSION = sys.intern("No extension")
+_SIZE_DIVISORS = (1, 1 << 10, 1 << 20, 1 << 30, 1 << 40, 1 << 50)
+
+
+def _iter_nodes(root_info: 'FileInfo'):
+    """Yield every node in the tree using an explicit stack."""
+    stack = [root_info]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        info = pop()
+        yield info
+        if info.children:
+            extend(info.children)
 
 
-@dataclass
 class FileInfo:
-    """Information about a file or directory."""
-    path: Path
-    name: str
-    size: int
-    is_directory: bool
-    extension: str
-    modified_time: float
-    children: Optional[List['FileInfo']] = None
-    
-    def __post_init__(self) -> None:
-        if self.children is None:
-            self.children = []
+    """Information about a file or directory.
+
+    Uses __slots__ instead of a dataclass to avoid the per-instance dict;
+    leaf nodes keep children as None so files carry no empty list.
+    """
+
+    __slots__ = (
+        "path", "name", "size", "is_directory", "extension", "modified_time",
+        "children", "scan_stats"
+    )
+
+    def __init__(
+        self,
+        path: Path,
+        name: str,
+        size: int,
+        is_directory: bool,
+        extension: str,
+        modified_time: int,
+        children: Optional[List['FileInfo']] = None
+    ) -> None:
+        self.path = path
+        self.name = name
+        self.size = size
+        self.is_directory = is_directory
+        self.extension = extension
+        self.modified_time = modified_time
+        if children is None and is_directory:
+            children = []
+        self.children = children
+        self.scan_stats: Optional['ScanStats'] = None
+
+
+class ScanStats:
+    """Aggregate statistics collected in a single pass during a scan.
+
+    Populated by DiskAnalyzer while the tree is being built so that report
+    generation does not have to re-walk the whole FileInfo tree afterwards.
+    """
+
+    TOP_K = 128
+
+    __slots__ = (
+        "ext_stats", "total_files", "total_folders", "sum_file_size",
+        "largest_file", "largest_folder", "max_depth", "deepest_path",
+        "_topk", "_seq", "_lock"
+    )
+
+    def __init__(self) -> None:
+        self.ext_stats: Dict[str, List[int]] = {}
+        self.total_files = 0
+        self.total_folders = 0
+        self.sum_file_size = 0
+        self.largest_file: Optional[FileInfo] = None
+        self.largest_folder: Optional[FileInfo] = None
+        self.max_depth = 0
+        self.deepest_path = ""
+        self._topk: List[Any] = []
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def add(self, info: FileInfo, depth: int = 0) -> None:
+        """Record a node whose final size is known."""
+        with self._lock:
+            if info.is_directory:
+                self.total_folders += 1
+                if (self.largest_folder is None
+                        or info.size > self.largest_folder.size):
+                    self.largest_folder = info
+            else:
+                ext = info.extension or _NO_EXTENSION
+                entry = self.ext_stats.get(ext)
+                if entry is None:
+                    entry = self.ext_stats[ext] = [0, 0]
+                entry[0] += 1
+                entry[1] += info.size
+
+                self.total_files += 1
+                self.sum_file_size += info.size
+                if (self.largest_file is None
+                        or info.size > self.largest_file.size):
+                    self.largest_file = info
+
+            if depth > self.max_depth:
+                self.max_depth = depth
+                self.deepest_path = str(info.path)
+
+            self._seq += 1
+            item = (info.size, self._seq, info)
+            topk = self._topk
+            if len(topk) < self.TOP_K:
+                heapq.heappush(topk, item)
+            else:
+                heapq.heappushpop(topk, item)
+
+    def add_files(self, infos: List[FileInfo], depth: int) -> None:
+        """Record one directory's files in a single lock acquisition.
+
+        Scan workers batch their files per directory so lock traffic scales
+        with directory count, not file count; inside the lock everything is
+        kept in locals until the final writeback.
+        """
+        if not infos:
+            return
+        with self._lock:
+            ext_stats = self.ext_stats
+            topk = self._topk
+            top_k = self.TOP_K
+            push = heapq.heappush
+            pushpop = heapq.heappushpop
+            seq = self._seq
+            largest = self.largest_file
+            largest_size = largest.size if largest is not None else -1
+            sum_size = 0
+
+            for info in infos:
+                size = info.size
+                ext = info.extension or _NO_EXTENSION
+                entry = ext_stats.get(ext)
+                if entry is None:
+                    entry = ext_stats[ext] = [0, 0]
+                entry[0] += 1
+                entry[1] += size
+
+                sum_size += size
+                if size > largest_size:
+                    largest_size = size
+                    largest = info
+
+                seq += 1
+                item = (size, seq, info)
+                if len(topk) < top_k:
+                    push(topk, item)
+                else:
+                    pushpop(topk, item)
+
+            self._seq = seq
+            self.total_files += len(infos)
+            self.sum_file_size += sum_size
+            self.largest_file = largest
+            if depth > self.max_depth:
+                self.max_depth = depth
+                self.deepest_path = str(infos[0].path)
+
+    def file_type_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return per-extension stats sorted by total size."""
+        return {
+            ext: {"count": entry[0], "size": entry[1]}
+            for ext, entry in sorted(
+                self.ext_stats.items(), key=lambda x: x[1][1], reverse=True
+            )
+        }
+
+    def largest_items(self, count: int) -> Optional[List[FileInfo]]:
+        """Return the largest nodes, or None if count exceeds the kept heap."""
+        if count > len(self._topk) and len(self._topk) >= self.TOP_K:
+            return None
+        return [item[2] for item in heapq.nlargest(count, self._topk)]
 
 
 class DiskAnalyzer:
@@ -32,6 +202,7 @@ class DiskAnalyzer:
     
     def __init__(self) -> None:
         self.is_scanning = False
+        self._cancel = threading.Event()
         self.scan_thread: Optional[threading.Thread] = None
         self.progress_callback: Optional[Callable[[int, str], None]] = None
         self.completion_callback: Optional[Callable[[FileInfo], None]] = None
@@ -52,6 +223,7 @@ class DiskAnalyzer:
         self.completion_callback = completion_callback
         self.error_callback = error_callback
         
+        self._cancel.clear()
         self.scan_thread = threading.Thread(
             target=self._scan_directory_threaded,
             args=(root_path,),
@@ -61,10 +233,13 @@ class DiskAnalyzer:
         self.scan_thread.start()
         
     def stop_scan(self) -> None:
-        """Stop the current scan."""
+        """Request cancellation of the current scan without blocking.
+
+        The scan worker checks the cancel flag cooperatively and is a
+        daemon thread, so there is no need to join it from the caller.
+        """
+        self._cancel.set()
         self.is_scanning = False
-        if self.scan_thread:
-            self.scan_thread.join(timeout=1.0)
             
     def _scan_directory_threaded(self, root_path: str) -> None:
         """Thread worker for directory scanning."""
@@ -78,54 +253,24 @@ class DiskAnalyzer:
         finally:
             self.is_scanning = False
             
-    def _scan_directory(self, path: Path, depth: int = 0) -> FileInfo:
-        """Recursively scan a directory and return file information."""
-        if not self.is_scanning:
+    def _scan_directory(self, path: Path) -> FileInfo:
+        """Iteratively scan a directory tree and return file information.
+
+        Uses os.scandir so that the entry type and stat result come from a
+        single directory read instead of separate syscalls per entry.
+
+        Directories are fanned out across a thread pool: each task owns one
+        directory's FileInfo and submits its subdirectories as new tasks, so
+        threads overlap stat latency instead of idling on it. Sizes are
+        aggregated after the pool drains with one reverse pass over the
+        discovery-ordered directory list.
+        """
+        if self._cancel.is_set():
             raise InterruptedError("Scan was stopped")
-            
+
         try:
             stat_info = path.stat()
-            name = path.name if path.name else str(path)
-            
-            if self.progress_callback:
-                self.progress_callback(depth, str(path))
-            
-            file_info = FileInfo(
-                path=path,
-                name=name,
-                size=0,
-                is_directory=path.is_dir(),
-                extension=path.suffix.lower() if path.suffix else "",
-                modified_time=stat_info.st_mtime
-            )
-            
-            if path.is_dir():
-                total_size = 0
-                try:
-                    for child_path in path.iterdir():
-                        if not self.is_scanning:
-                            break
-                            
-                        try:
-                            child_info = self._scan_directory(child_path, depth + 1)
-                            file_info.children.append(child_info)
-                            total_size += child_info.size
-                        except (PermissionError, FileNotFoundError, OSError):
-                            # Skip inaccessible files/directories
-                            continue
-                            
-                    file_info.size = total_size
-                    
-                except (PermissionError, OSError):
-                    # If we can't read the directory, treat it as a file
-                    file_info.size = stat_info.st_size
-                    
-            else:
-                file_info.size = stat_info.st_size
-                
-            return file_info
-            
-        except Exception as e:
+        except OSError:
             # Return a minimal file info for failed entries
             return FileInfo(
                 path=path,
@@ -135,15 +280,168 @@ class DiskAnalyzer:
                 extension="",
                 modified_time=0
             )
+
+        # The stat result already answers is_dir; asking the Path again
+        # would cost another syscall for no new information.
+        is_directory = stat_module.S_ISDIR(stat_info.st_mode)
+        root_info = FileInfo(
+            path=path,
+            name=path.name if path.name else str(path),
+            size=0,
+            is_directory=is_directory,
+            extension="" if is_directory else path.suffix.lower(),
+            modified_time=int(stat_info.st_mtime)
+        )
+
+        if not root_info.is_directory:
+            root_info.size = stat_info.st_size
+            return root_info
+
+        # Directories (with their depth) in discovery order; parents always
+        # precede their children, so a single reverse pass aggregates sizes
+        # bottom-up.
+        directories = [(root_info, 0)]
+        directories_lock = threading.Lock()
+        stats = ScanStats()
+
+        # Only ~100 distinct extensions exist on a typical tree; intern them
+        # once so millions of nodes share the same string objects and dict
+        # lookups in the stats path hit pointer equality.
+        ext_cache: Dict[str, str] = {}
+
+        # Track outstanding directory tasks so the scan thread knows when
+        # the workers have drained the whole tree.
+        pending = 1
+        pending_lock = threading.Lock()
+        all_done = threading.Event()
+
+        def finish_task() -> None:
+            nonlocal pending
+            with pending_lock:
+                pending -= 1
+                if pending == 0:
+                    all_done.set()
+
+        def submit(dir_info: FileInfo, depth: int) -> None:
+            nonlocal pending
+            with pending_lock:
+                pending += 1
+            executor.submit(scan_one, dir_info, depth)
+
+        def scan_one(dir_info: FileInfo, depth: int) -> None:
+            """Scan a single directory; each FileInfo is owned by one task."""
+            try:
+                if cancelled():
+                    return
+
+                if progress is not None:
+                    progress(depth, str(dir_info.path))
+
+                try:
+                    entries = os.scandir(dir_info.path)
+                except (PermissionError, FileNotFoundError, OSError):
+                    # Skip unreadable directories
+                    return
+
+                # Hoist globals and bound methods out of the per-entry loop;
+                # this loop runs once per filesystem entry and the lookups
+                # add up on million-file trees.
+                file_info = FileInfo
+                make_path = Path
+                append_child = dir_info.children.append
+                get_ext = ext_cache.get
+                set_ext = ext_cache.setdefault
+                child_depth = depth + 1
+
+                # Files are batched per directory and merged into the
+                # shared stats in one locked call after the entry loop.
+                file_batch: List[FileInfo] = []
+                add_file = file_batch.append
+
+                with entries:
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                            entry_stat = entry.stat(follow_symlinks=False)
+                        except (PermissionError, FileNotFoundError, OSError):
+                            # Skip inaccessible files/directories
+                            continue
+
+                        name = entry.name
+                        if is_dir:
+                            extension = ""
+                        else:
+                            dot = name.rfind('.')
+                            if 0 < dot < len(name) - 1:
+                                raw = name[dot:]
+                                extension = get_ext(raw)
+                                if extension is None:
+                                    extension = set_ext(
+                                        raw, sys.intern(raw.lower())
+                                    )
+                            else:
+                                extension = ""
+
+                        child_info = file_info(
+                            path=make_path(entry.path),
+                            name=name,
+                            size=0 if is_dir else entry_stat.st_size,
+                            is_directory=is_dir,
+                            extension=extension,
+                            # Whole-second precision is enough for display
+                            # and lets exporters cache formatted timestamps.
+                            modified_time=int(entry_stat.st_mtime)
+                        )
+                        append_child(child_info)
+
+                        if is_dir:
+                            with directories_lock:
+                                directories.append((child_info, child_depth))
+                            submit(child_info, child_depth)
+                        else:
+                            add_file(child_info)
+
+                stats.add_files(file_batch, child_depth)
+            finally:
+                finish_task()
+
+        cancelled = self._cancel.is_set
+        progress = self.progress_callback
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            executor.submit(scan_one, root_info, 0)
+            all_done.wait()
+
+        if cancelled():
+            raise InterruptedError("Scan was stopped")
+
+        for dir_info, depth in reversed(directories):
+            dir_info.size = sum(child.size for child in dir_info.children)
+            stats.add(dir_info, depth)
+
+        # Pre-sort children largest-first, the order every view presents by
+        # default; consumers re-sorting into this order see a no-op pass.
+        size_key = attrgetter('size')
+        for dir_info, _ in directories:
+            dir_info.children.sort(key=size_key, reverse=True)
+
+        root_info.scan_stats = stats
+        return root_info
             
     @staticmethod
     def get_available_drives() -> List[str]:
         """Get list of available disk drives."""
         drives = []
         if os.name == 'nt':  # Windows
-            for partition in psutil.disk_partitions():
-                if 'cdrom' not in partition.opts:
-                    drives.append(partition.mountpoint)
+            import ctypes
+
+            DRIVE_CDROM = 5
+            kernel32 = ctypes.windll.kernel32
+            buffer = ctypes.create_unicode_buffer(512)
+            length = kernel32.GetLogicalDriveStringsW(len(buffer), buffer)
+            for drive in buffer[:length].split('\x00'):
+                if drive and kernel32.GetDriveTypeW(drive) != DRIVE_CDROM:
+                    drives.append(drive)
         else:  # Unix-like systems
             drives = ['/']
             # Add common mount points
@@ -154,60 +452,58 @@ class DiskAnalyzer:
         return drives
         
     @staticmethod
+    @lru_cache(maxsize=4096)
     def format_size(size_bytes: int) -> str:
-        """Format file size in human readable format."""
-        if size_bytes == 0:
+        """Format file size in human readable format.
+
+        Pure function of an int, so repeated values across stats refreshes
+        (label updates, re-sorted columns) hit the cache.
+        """
+        if size_bytes <= 0:
             return "0 B"
-            
-        units = ['B', 'KB', 'MB', 'GB', 'TB', 'PB']
-        unit_index = 0
-        size = float(size_bytes)
-        
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
-            
+
+        # bit_length picks the unit directly: each unit step is 10 bits.
+        unit_index = min((size_bytes.bit_length() - 1) // 10, 5)
         if unit_index == 0:
-            return f"{int(size)} {units[unit_index]}"
-        else:
-            return f"{size:.1f} {units[unit_index]}"
+            return f"{size_bytes} {_SIZE_UNITS[0]}"
+        return f"{size_bytes / _SIZE_DIVISORS[unit_index]:.1f} {_SIZE_UNITS[unit_index]}"
             
     @staticmethod
     def get_file_type_stats(root_info: FileInfo) -> Dict[str, Dict[str, Any]]:
         """Get statistics about file types."""
-        stats = {}
-        
-        def collect_stats(info: FileInfo) -> None:
+        if root_info.scan_stats is not None:
+            return root_info.scan_stats.file_type_stats()
+
+        # Fallback walk: single dict lookup per file into [count, size]
+        # entries; the nested result dicts are only built at the end.
+        stats: Dict[str, List[int]] = {}
+        get_entry = stats.get
+        for info in _iter_nodes(root_info):
             if not info.is_directory:
-                ext = info.extension or "No extension"
-                if ext not in stats:
-                    stats[ext] = {"count": 0, "size": 0}
-                stats[ext]["count"] += 1
-                stats[ext]["size"] += info.size
-            
-            for child in info.children:
-                collect_stats(child)
-                
-        collect_stats(root_info)
-        
-        # Sort by total size
-        sorted_stats = dict(
-            sorted(stats.items(), key=lambda x: x[1]["size"], reverse=True)
-        )
-        
-        return sorted_stats
+                ext = info.extension or _NO_EXTENSION
+                entry = get_entry(ext)
+                if entry is None:
+                    entry = stats[ext] = [0, 0]
+                entry[0] += 1
+                entry[1] += info.size
+
+        return {
+            ext: {"count": entry[0], "size": entry[1]}
+            for ext, entry in sorted(
+                stats.items(), key=lambda x: x[1][1], reverse=True
+            )
+        }
         
     @staticmethod
     def get_largest_items(root_info: FileInfo, count: int = 10) -> List[FileInfo]:
         """Get the largest files and directories."""
-        all_items = []
-        
-        def collect_items(info: FileInfo) -> None:
-            all_items.append(info)
-            for child in info.children:
-                collect_items(child)
-                
-        collect_items(root_info)
-        
-        # Sort by size and return top items
-        return sorted(all_items, key=lambda x: x.size, reverse=True)[:count]
+        if root_info.scan_stats is not None:
+            items = root_info.scan_stats.largest_items(count)
+            if items is not None:
+                return items
+
+        # Stream the tree through a size-count heap instead of sorting every
+        # node; O(N log K) and no intermediate list of all nodes.
+        return heapq.nlargest(
+            count, _iter_nodes(root_info), key=attrgetter('size')
+        )
@@ -4,6 +4,7 @@ Export functionality for Soko-Mushi reports.
 
 import json
 import csv
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any
 from datetime import datetime
@@ -11,31 +12,32 @@ from datetime import datetime
 from .analyzer import FileInfo, DiskAnalyzer
 
 
+@lru_cache(maxsize=65536)
+def _format_mtime(mtime: int) -> str:
+    """Format an epoch timestamp as ISO 8601, cached on the whole second.
+
+    Files created by the same install or extraction share timestamps, so the
+    cache hit rate is high on real trees.
+    """
+    return datetime.fromtimestamp(mtime).isoformat() if mtime > 0 else ""
+
+
 class ReportExporter:
     """Handle exporting scan results to various formats."""
     
     @staticmethod
     def export_to_json(root_info: FileInfo, output_path: str) -> None:
-        """Export scan results to JSON format."""
-        def file_info_to_dict(info: FileInfo) -> Dict[str, Any]:
-            return {
-                "path": str(info.path),
-                "name": info.name,
-                "size": info.size,
-                "size_formatted": DiskAnalyzer.format_size(info.size),
-                "is_directory": info.is_directory,
-                "extension": info.extension,
-                "modified_time": info.modified_time,
-                "modified_time_formatted": datetime.fromtimestamp(info.modified_time).isoformat() if info.modified_time > 0 else "",
-                "children": [file_info_to_dict(child) for child in info.children]
-            }
-        
-        report_data = {
+        """Export scan results to JSON format.
+
+        The file tree is streamed node by node instead of mirroring the whole
+        FileInfo tree into nested dicts before serialization, keeping peak
+        memory independent of tree size.
+        """
+        header = {
             "scan_timestamp": datetime.now().isoformat(),
             "root_path": str(root_info.path),
             "total_size": root_info.size,
             "total_size_formatted": DiskAnalyzer.format_size(root_info.size),
-            "file_tree": file_info_to_dict(root_info),
             "file_type_stats": DiskAnalyzer.get_file_type_stats(root_info),
             "largest_items": [
                 {
@@ -48,37 +50,106 @@ class ReportExporter:
                 for item in DiskAnalyzer.get_largest_items(root_info, 50)
             ]
         }
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, indent=2, ensure_ascii=False)
+
+        with open(output_path, 'w', encoding='utf-8',
+                  buffering=1 << 20) as f:
+            write = f.write
+            write('{')
+            for key, value in header.items():
+                write(json.dumps(key))
+                write(': ')
+                write(json.dumps(value, ensure_ascii=False))
+                write(', ')
+            write('"file_tree": ')
+            ReportExporter._write_file_tree(f, root_info)
+            write('}')
+
+    @staticmethod
+    def _write_node_open(out, info: FileInfo) -> None:
+        """Write a node record, leaving its children array open."""
+        mtime = int(info.modified_time)
+        record = {
+            "path": str(info.path),
+            "name": info.name,
+            "size": info.size,
+            "size_formatted": DiskAnalyzer.format_size(info.size),
+            "is_directory": info.is_directory,
+            "extension": info.extension,
+            "modified_time": mtime,
+            "modified_time_formatted": _format_mtime(mtime),
+        }
+        # Emit the node record with its closing brace replaced by a
+        # streamed children array.
+        out.write(json.dumps(record, ensure_ascii=False)[:-1])
+        out.write(', "children": [')
+
+    @staticmethod
+    def _write_file_tree(out, root_info: FileInfo) -> None:
+        """Write a FileInfo subtree as a JSON object without recursion.
+
+        Deep trees (node_modules, maildirs) would otherwise risk hitting the
+        interpreter recursion limit; each stack frame here is just an
+        iterator over a node's remaining children plus a first-child flag.
+        """
+        write = out.write
+        write_open = ReportExporter._write_node_open
+
+        write_open(out, root_info)
+        stack = [iter(root_info.children or ())]
+        first = [True]
+
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                first.pop()
+                write(']}')
+                continue
+            if first[-1]:
+                first[-1] = False
+            else:
+                write(', ')
+            write_open(out, child)
+            stack.append(iter(child.children or ()))
+            first.append(True)
     
+    CSV_FIELDS = (
+        "path", "name", "size", "size_formatted", "is_directory",
+        "extension", "depth", "modified_time"
+    )
+
     @staticmethod
     def export_to_csv(root_info: FileInfo, output_path: str) -> None:
-        """Export scan results to CSV format."""
-        all_items = []
-        
-        def collect_items(info: FileInfo, depth: int = 0) -> None:
-            all_items.append({
-                "path": str(info.path),
-                "name": info.name,
-                "size": info.size,
-                "size_formatted": DiskAnalyzer.format_size(info.size),
-                "is_directory": "Yes" if info.is_directory else "No",
-                "extension": info.extension,
-                "depth": depth,
-                "modified_time": datetime.fromtimestamp(info.modified_time).isoformat() if info.modified_time > 0 else ""
-            })
-            
-            for child in info.children:
-                collect_items(child, depth + 1)
-        
-        collect_items(root_info)
-        
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            if all_items:
-                writer = csv.DictWriter(f, fieldnames=all_items[0].keys())
-                writer.writeheader()
-                writer.writerows(all_items)
+        """Export scan results to CSV format.
+
+        Rows are streamed from a stack-based walk straight into csv.writer,
+        so no intermediate list of row dicts is built.
+        """
+        def iter_rows(info: FileInfo):
+            format_size = DiskAnalyzer.format_size
+            stack = [(info, 0)]
+            pop = stack.pop
+            while stack:
+                node, depth = pop()
+                yield (
+                    str(node.path),
+                    node.name,
+                    node.size,
+                    format_size(node.size),
+                    "Yes" if node.is_directory else "No",
+                    node.extension,
+                    depth,
+                    _format_mtime(int(node.modified_time))
+                )
+                if node.children:
+                    child_depth = depth + 1
+                    stack.extend((child, child_depth) for child in node.children)
+
+        with open(output_path, 'w', newline='', encoding='utf-8',
+                  buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(ReportExporter.CSV_FIELDS)
+            writer.writerows(iter_rows(root_info))
     
     @staticmethod
     def export_file_types_csv(root_info: FileInfo, output_path: str) -> None:
@@ -88,17 +159,19 @@ class ReportExporter:
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             writer.writerow(["File Extension", "File Count", "Total Size (Bytes)", "Total Size (Formatted)", "Percentage of Total"])
-            
+
             total_size = root_info.size
-            for ext, data in stats.items():
-                percentage = (data["size"] / total_size * 100) if total_size > 0 else 0
-                writer.writerow([
+            format_size = DiskAnalyzer.format_size
+            writer.writerows(
+                (
                     ext,
                     data["count"],
                     data["size"],
-                    DiskAnalyzer.format_size(data["size"]),
-                    f"{percentage:.2f}%"
-                ])
+                    format_size(data["size"]),
+                    f"{(data['size'] / total_size * 100) if total_size > 0 else 0:.2f}%"
+                )
+                for ext, data in stats.items()
+            )
     
     @staticmethod
     def export_largest_items_csv(root_info: FileInfo, output_path: str, count: int = 100) -> None:
@@ -108,13 +181,16 @@ class ReportExporter:
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             writer.writerow(["Rank", "Path", "Name", "Size (Bytes)", "Size (Formatted)", "Type"])
-            
-            for i, item in enumerate(largest_items, 1):
-                writer.writerow([
+
+            format_size = DiskAnalyzer.format_size
+            writer.writerows(
+                (
                     i,
                     str(item.path),
                     item.name,
                     item.size,
-                    DiskAnalyzer.format_size(item.size),
+                    format_size(item.size),
                     "Directory" if item.is_directory else "File"
-                ])
+                )
+                for i, item in enumerate(largest_items, 1)
+            )
@@ -6,6 +6,7 @@ Main window for Soko-Mushi application using PySide6.
 
 import sys
 import shutil
+import threading
 from typing import Optional
 from pathlib import Path
 
@@ -25,10 +26,158 @@ from .toolbar import ToolbarWidget
 
 
 
+# Per-widget stylesheets, built once at import. Scoping each sheet to the
+# widget it styles means a theme switch recomputes four small subtrees
+# instead of cascading one application-wide sheet through every widget.
+_LIGHT_TREE_QSS = """
+    QTreeView {
+        background-color: white;
+        alternate-background-color: #f8f8f8;
+        color: black;
+        border: 1px solid #d0d0d0;
+    }
+    QTreeView::item {
+        padding: 4px;
+        border-bottom: 1px solid #e0e0e0;
+    }
+    QTreeView::item:selected {
+        background-color: #0078d4;
+        color: white;
+    }
+    QTreeView::item:hover {
+        background-color: #e5f3ff;
+    }
+"""
+
+_DARK_TREE_QSS = """
+    QTreeView {
+        background-color: #383838;
+        alternate-background-color: #404040;
+        color: white;
+        border: 1px solid #555555;
+    }
+    QTreeView::item {
+        padding: 4px;
+        border-bottom: 1px solid #555555;
+    }
+    QTreeView::item:selected {
+        background-color: #0078d4;
+        color: white;
+    }
+    QTreeView::item:hover {
+        background-color: #505050;
+    }
+"""
+
+_THEMES = {
+    "Light": {
+        "window": """
+            QMainWindow {
+                background-color: #f0f0f0;
+                color: black;
+            }
+            QWidget {
+                background-color: #f0f0f0;
+                color: black;
+            }
+        """,
+        "tree": _LIGHT_TREE_QSS,
+        "panel": _LIGHT_TREE_QSS + """
+            QTabWidget::pane {
+                border: 1px solid #d0d0d0;
+                background-color: white;
+            }
+            QTabBar::tab {
+                background-color: #e8e8e8;
+                color: black;
+                padding: 8px 16px;
+                border: 1px solid #d0d0d0;
+                border-bottom: none;
+            }
+            QTabBar::tab:selected {
+                background-color: white;
+                border-bottom: 1px solid white;
+            }
+            QTabBar::tab:hover {
+                background-color: #f0f0f0;
+            }
+            QLabel {
+                color: black;
+            }
+            QFrame {
+                background-color: #f8f8f8;
+                border: 1px solid #d0d0d0;
+            }
+            QScrollArea {
+                background-color: white;
+                border: 1px solid #d0d0d0;
+            }
+        """,
+        "status_bar": """
+            QStatusBar {
+                background-color: #e8e8e8;
+                color: black;
+                border-top: 1px solid #d0d0d0;
+            }
+        """,
+    },
+    "Dark": {
+        "window": """
+            QMainWindow {
+                background-color: #2b2b2b;
+                color: white;
+            }
+            QWidget {
+                background-color: #2b2b2b;
+                color: white;
+            }
+        """,
+        "tree": _DARK_TREE_QSS,
+        "panel": _DARK_TREE_QSS + """
+            QTabWidget::pane {
+                border: 1px solid #555555;
+                background-color: #383838;
+            }
+            QTabBar::tab {
+                background-color: #404040;
+                color: white;
+                padding: 8px 16px;
+                border: 1px solid #555555;
+                border-bottom: none;
+            }
+            QTabBar::tab:selected {
+                background-color: #383838;
+                border-bottom: 1px solid #383838;
+            }
+            QTabBar::tab:hover {
+                background-color: #4a4a4a;
+            }
+            QLabel {
+                color: white;
+            }
+            QFrame {
+                background-color: #404040;
+                border: 1px solid #555555;
+            }
+            QScrollArea {
+                background-color: #383838;
+                border: 1px solid #555555;
+            }
+        """,
+        "status_bar": """
+            QStatusBar {
+                background-color: #404040;
+                color: white;
+                border-top: 1px solid #555555;
+            }
+        """,
+    },
+}
+
+
 class ScanThread(QThread):
     """Thread for disk scanning operations."""
 
-    progress_updated = Signal(int, str)
     scan_completed = Signal(object)  # FileInfo object
     scan_error = Signal(str)
 
@@ -36,19 +185,36 @@ class ScanThread(QThread):
         super().__init__()
         self.root_path = root_path
         self.analyzer = DiskAnalyzer()
+        # Latest (depth, path) seen by the scanner. Progress is pulled from
+        # here by a GUI-side timer instead of emitting a queued signal per
+        # file, which would flood the event loop on large trees.
+        self._progress_lock = threading.Lock()
+        self._last_progress: Optional[tuple[int, str]] = None
 
     def run(self):
         """Run the disk scan in background thread."""
         try:
             self.analyzer.start_scan(
                 self.root_path,
-                progress_callback=self.progress_updated.emit,
+                progress_callback=self._record_progress,
                 completion_callback=self.scan_completed.emit,
                 error_callback=self.scan_error.emit
             )
         except Exception as e:
             self.scan_error.emit(str(e))
 
+    def _record_progress(self, depth: int, path: str):
+        """Remember the most recent progress report (called off-thread)."""
+        with self._progress_lock:
+            self._last_progress = (depth, path)
+
+    def take_progress(self) -> Optional[tuple[int, str]]:
+        """Return and clear the latest progress report, if any."""
+        with self._progress_lock:
+            progress = self._last_progress
+            self._last_progress = None
+        return progress
+
     def stop_scan(self):
         """Stop the current scan."""
         self.analyzer.stop_scan()
@@ -62,7 +228,15 @@ class SokoMushiApp(QMainWindow):
         self.current_scan_data: Optional[FileInfo] = None
         self.scan_thread: Optional[ScanThread] = None
         self.is_scanning = False
-        
+        self._current_theme: Optional[str] = None
+
+        # Polls the scan thread for progress ~10x/s; coalesces the
+        # per-file reports into a rate the status bar can actually show.
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(100)
+        self._progress_timer.timeout.connect(self._poll_scan_progress)
+
+
         self._setup_ui()
         self._connect_signals()
         
@@ -108,10 +282,17 @@ class SokoMushiApp(QMainWindow):
         self.status_bar.addPermanentWidget(self.progress_bar)
         
         self.status_bar.showMessage("Ready - Select a folder to scan")
-        
-        # Apply initial theme
-        self._apply_application_theme("System")
-        
+
+        # Widgets that receive a scoped stylesheet on theme switches; the
+        # style system only recomputes these subtrees, not the whole app.
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        self._themed_widgets = (
+            (self, "window"),
+            (self.tree_view, "tree"),
+            (self.stats_panel, "panel"),
+            (self.status_bar, "status_bar"),
+        )
+
     def _connect_signals(self):
         """Connect widget signals to slots."""
         self.toolbar_widget.scan_requested.connect(self._on_scan_click)
@@ -152,21 +333,29 @@ class SokoMushiApp(QMainWindow):
         
         # Start scan thread
         self.scan_thread = ScanThread(folder_path)
-        self.scan_thread.progress_updated.connect(self._on_scan_progress)
         self.scan_thread.scan_completed.connect(self._on_scan_complete)
         self.scan_thread.scan_error.connect(self._on_scan_error)
         self.scan_thread.start()
+        self._progress_timer.start()
         
     def _stop_scan(self):
-        """Stop the current scan."""
+        """Request scan cancellation without blocking the event loop."""
         if self.scan_thread:
             self.scan_thread.stop_scan()
-            self.scan_thread.wait()
-            
+
         self._reset_scan_ui()
         
+    def _poll_scan_progress(self):
+        """Forward the latest coalesced progress report to the status bar."""
+        if self.scan_thread is None:
+            return
+        progress = self.scan_thread.take_progress()
+        if progress is not None:
+            self._on_scan_progress(*progress)
+
     def _reset_scan_ui(self):
         """Reset the scanning UI state."""
+        self._progress_timer.stop()
         self.is_scanning = False
         self.toolbar_widget.set_scan_button_text("Scan Folder")
         self.progress_bar.setVisible(False)
@@ -254,161 +443,59 @@ class SokoMushiApp(QMainWindow):
         
     def _apply_application_theme(self, theme: str):
         """Apply theme to the entire application."""
-        if theme == "Light":
-            self._apply_light_theme()
-        elif theme == "Dark":
-            self._apply_dark_theme()
-        else:  # System
-            self._apply_dark_theme()  # Default to dark for now
-            
-    def _apply_light_theme(self):
-        """Apply light theme to the application."""
-        app_style = """
-            QMainWindow {
-                background-color: #f0f0f0;
-                color: black;
-            }
-            QWidget {
-                background-color: #f0f0f0;
-                color: black;
-            }
-            QTreeWidget {
-                background-color: white;
-                alternate-background-color: #f8f8f8;
-                color: black;
-                border: 1px solid #d0d0d0;
-            }
-            QTreeWidget::item {
-                padding: 4px;
-                border-bottom: 1px solid #e0e0e0;
-            }
-            QTreeWidget::item:selected {
-                background-color: #0078d4;
-                color: white;
-            }
-            QTreeWidget::item:hover {
-                background-color: #e5f3ff;
-            }
-            QTabWidget::pane {
-                border: 1px solid #d0d0d0;
-                background-color: white;
-            }
-            QTabBar::tab {
-                background-color: #e8e8e8;
-                color: black;
-                padding: 8px 16px;
-                border: 1px solid #d0d0d0;
-                border-bottom: none;
-            }
-            QTabBar::tab:selected {
-                background-color: white;
-                border-bottom: 1px solid white;
-            }
-            QTabBar::tab:hover {
-                background-color: #f0f0f0;
-            }
-            QLabel {
-                color: black;
-            }
-            QFrame {
-                background-color: #f8f8f8;
-                border: 1px solid #d0d0d0;
-            }
-            QScrollArea {
-                background-color: white;
-                border: 1px solid #d0d0d0;
-            }
-            QStatusBar {
-                background-color: #e8e8e8;
-                color: black;
-                border-top: 1px solid #d0d0d0;
-            }
-        """
-        self.setStyleSheet(app_style)
-        
-    def _apply_dark_theme(self):
-        """Apply dark theme to the application."""
-        app_style = """
-            QMainWindow {
-                background-color: #2b2b2b;
-                color: white;
-            }
-            QWidget {
-                background-color: #2b2b2b;
-                color: white;
-            }
-            QTreeWidget {
-                background-color: #383838;
-                alternate-background-color: #404040;
-                color: white;
-                border: 1px solid #555555;
-            }
-            QTreeWidget::item {
-                padding: 4px;
-                border-bottom: 1px solid #555555;
-            }
-            QTreeWidget::item:selected {
-                background-color: #0078d4;
-                color: white;
-            }
-            QTreeWidget::item:hover {
-                background-color: #505050;
-            }
-            QTabWidget::pane {
-                border: 1px solid #555555;
-                background-color: #383838;
-            }
-            QTabBar::tab {
-                background-color: #404040;
-                color: white;
-                padding: 8px 16px;
-                border: 1px solid #555555;
-                border-bottom: none;
-            }
-            QTabBar::tab:selected {
-                background-color: #383838;
-                border-bottom: 1px solid #383838;
-            }
-            QTabBar::tab:hover {
-                background-color: #4a4a4a;
-            }
-            QLabel {
-                color: white;
-            }
-            QFrame {
-                background-color: #404040;
-                border: 1px solid #555555;
-            }
-            QScrollArea {
-                background-color: #383838;
-                border: 1px solid #555555;
-            }
-            QStatusBar {
-                background-color: #404040;
-                color: white;
-                border-top: 1px solid #555555;
-            }
-        """
-        self.setStyleSheet(app_style)
-        
+        if theme == self._current_theme:
+            return  # each setStyleSheet recomputes a subtree; skip no-ops
+        self._current_theme = theme
+
+        sheets = _THEMES.get(theme, _THEMES["Dark"])  # System defaults to dark
+        for widget, key in self._themed_widgets:
+            widget.setStyleSheet(sheets[key])
+
     def closeEvent(self, event):
         """Handle application closing."""
         if self.is_scanning and self.scan_thread:
+            # Cooperative cancellation; the scan worker is a daemon thread
+            # and cannot keep the process alive, so no need to wait for it.
             self.scan_thread.stop_scan()
-            self.scan_thread.wait()
         event.accept()
 
 
+class ExportThread(QThread):
+    """Runs a ReportExporter function off the GUI thread.
+
+    Serializing a large scan walks the whole FileInfo tree and does
+    synchronous file I/O; doing that on the GUI thread freezes the app.
+    """
+
+    finished_ok = Signal(str)
+    failed = Signal(str)
+
+    def __init__(self, exporter_fn, scan_data: FileInfo, file_path: str):
+        super().__init__()
+        self._exporter_fn = exporter_fn
+        self._scan_data = scan_data
+        self._file_path = file_path
+
+    def run(self):
+        try:
+            self._exporter_fn(self._scan_data, self._file_path)
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.finished_ok.emit(self._file_path)
+
+
 class ExportDialog(QDialog):
     """Dialog for export options."""
-    
+
     def __init__(self, parent: QMainWindow, scan_data: FileInfo):
         super().__init__(parent)
         self.scan_data = scan_data
+        self.export_thread: Optional[ExportThread] = None
         self.setWindowTitle("Export Report")
         self.setModal(True)
         self.resize(400, 300)
-        
+
         self._setup_ui()
         
     def _setup_ui(self):
@@ -441,29 +528,39 @@ class ExportDialog(QDialog):
         layout.addWidget(self.largest_radio)
         
         layout.addStretch()
-        
+
+        # Indeterminate progress shown while the export thread runs
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+
         # Dialog buttons
-        button_box = QDialogButtonBox(
+        self.button_box = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
         )
-        button_box.accepted.connect(self._export)
-        button_box.rejected.connect(self.reject)
-        layout.addWidget(button_box)
-        
+        self.button_box.accepted.connect(self._export)
+        self.button_box.rejected.connect(self.reject)
+        layout.addWidget(self.button_box)
+
     def _export(self):
-        """Perform the export."""
+        """Start the export on a worker thread."""
         export_type = self.button_group.checkedId()
-        
-        # File filters and default names
+
+        # File filters, default names and exporter per option
         filters = {
-            0: ("JSON files (*.json)", "soko_mushi_report.json", ".json"),
-            1: ("CSV files (*.csv)", "soko_mushi_files.csv", ".csv"),
-            2: ("CSV files (*.csv)", "soko_mushi_file_types.csv", ".csv"),
-            3: ("CSV files (*.csv)", "soko_mushi_largest_items.csv", ".csv"),
+            0: ("JSON files (*.json)", "soko_mushi_report.json",
+                ReportExporter.export_to_json),
+            1: ("CSV files (*.csv)", "soko_mushi_files.csv",
+                ReportExporter.export_to_csv),
+            2: ("CSV files (*.csv)", "soko_mushi_file_types.csv",
+                ReportExporter.export_file_types_csv),
+            3: ("CSV files (*.csv)", "soko_mushi_largest_items.csv",
+                ReportExporter.export_largest_items_csv),
         }
-        
-        file_filter, default_name, extension = filters[export_type]
-        
+
+        file_filter, default_name, exporter_fn = filters[export_type]
+
         # Ask for save location
         file_path, _ = QFileDialog.getSaveFileName(
             self,
@@ -471,26 +568,30 @@ class ExportDialog(QDialog):
             default_name,
             file_filter
         )
-        
+
         if not file_path:
             return
-            
-        try:
-            # Perform export
-            if export_type == 0:  # JSON
-                ReportExporter.export_to_json(self.scan_data, file_path)
-            elif export_type == 1:  # CSV
-                ReportExporter.export_to_csv(self.scan_data, file_path)
-            elif export_type == 2:  # Types CSV
-                ReportExporter.export_file_types_csv(self.scan_data, file_path)
-            elif export_type == 3:  # Largest CSV
-                ReportExporter.export_largest_items_csv(self.scan_data, file_path)
-                
-            QMessageBox.information(self, "Export Complete", f"Report exported to:\n{file_path}")
-            self.accept()
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Export Error", f"Failed to export report:\n{str(e)}")
+
+        # Keep the dialog responsive while the report is written
+        self.button_box.setEnabled(False)
+        self.progress_bar.setVisible(True)
+
+        self.export_thread = ExportThread(exporter_fn, self.scan_data, file_path)
+        self.export_thread.finished_ok.connect(self._on_export_done)
+        self.export_thread.failed.connect(self._on_export_failed)
+        self.export_thread.start()
+
+    def _on_export_done(self, file_path: str):
+        """Handle successful export completion."""
+        self.progress_bar.setVisible(False)
+        QMessageBox.information(self, "Export Complete", f"Report exported to:\n{file_path}")
+        self.accept()
+
+    def _on_export_failed(self, error_message: str):
+        """Handle export failure."""
+        self.progress_bar.setVisible(False)
+        self.button_box.setEnabled(True)
+        QMessageBox.critical(self, "Export Error", f"Failed to export report:\n{error_message}")
 
 
 def run_app():
@@ -501,5 +602,9 @@ def run_app():
     
     window = SokoMushiApp()
     window.show()
-    
+
+    # Apply the initial theme after the window is shown so the style system
+    # resolves it once against the full widget tree.
+    QTimer.singleShot(0, lambda: window._apply_application_theme("System"))
+
     return app.exec()
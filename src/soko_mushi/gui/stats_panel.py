@@ -8,39 +8,98 @@ from datetime import datetime
 
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QTabWidget, QTreeWidget, QTreeWidgetItem,
+    QWidget, QVBoxLayout, QLabel, QTabWidget, QTreeView,
     QScrollArea, QFrame, QHBoxLayout
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
 
 
 from ..core import FileInfo, DiskAnalyzer
 
 
-class NumericTreeWidgetItem(QTreeWidgetItem):
-    """QTreeWidgetItem with proper numeric sorting support."""
+class FlatTableModel(QAbstractTableModel):
+    """Flat, sortable table backed by plain Python rows.
 
-    def __lt__(self, other):
-        column = self.treeWidget().sortColumn()
-        try:
-            self_data = self.data(column, Qt.ItemDataRole.UserRole)
-            other_data = other.data(column, Qt.ItemDataRole.UserRole)
-            if self_data is not None and other_data is not None:
-                return self_data < other_data
-        except Exception:
-            pass
-        # Fallback: compare text directly, do NOT call base class (avoids recursion on macOS/PySide6)
-        self_text = self.text(column)
-        other_text = other.text(column)
-        return self_text < other_text
+    Display text and sort keys live in parallel per-row tuples, so
+    populating a table is a single model reset and sorting one list sort —
+    no per-row QTreeWidgetItem allocations and no __lt__ dispatches
+    crossing the Qt boundary.
+    """
+
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._cells = []
+        self._keys = []
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._cells)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self._headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._cells[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (role == Qt.ItemDataRole.DisplayRole
+                and orientation == Qt.Orientation.Horizontal):
+            return self._headers[section]
+        return None
+
+    def set_rows(self, cells, keys):
+        """Replace all rows in one reset, re-applying the current sort."""
+        self.beginResetModel()
+        self._cells = cells
+        self._keys = keys
+        self.endResetModel()
+        if self._sort_column >= 0:
+            self.sort(self._sort_column, self._sort_order)
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self._sort_column = column
+        self._sort_order = order
+        if not self._cells:
+            return
+        self.layoutAboutToBeChanged.emit()
+        keys = self._keys
+        ordering = sorted(
+            range(len(keys)),
+            key=lambda row: keys[row][column],
+            reverse=order == Qt.SortOrder.DescendingOrder
+        )
+        self._keys = [keys[row] for row in ordering]
+        self._cells = [self._cells[row] for row in ordering]
+        # Persistent indexes (the selection, the current row) must follow
+        # their rows to the new positions, or the highlight silently lands
+        # on a different entry after the sort.
+        new_row_of = {old: new for new, old in enumerate(ordering)}
+        old_persistent = self.persistentIndexList()
+        new_persistent = [
+            self.createIndex(new_row_of[index.row()], index.column())
+            if index.isValid() else index
+            for index in old_persistent
+        ]
+        self.changePersistentIndexList(old_persistent, new_persistent)
+        self.layoutChanged.emit()
 
 
 class StatsWidget(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Types/largest tabs are populated lazily on first view; the dirty
+        # flags mark them stale until then.
+        self._scan_data: Optional[FileInfo] = None
+        self._types_dirty = False
+        self._largest_dirty = False
         self._setup_ui()
-        
+        self.tab_widget.currentChanged.connect(self._on_tab_change)
+
     def _setup_ui(self):
         """Setup statistics UI."""
         layout = QVBoxLayout(self)
@@ -126,80 +185,130 @@ class StatsWidget(QWidget):
         
     def _create_types_tab(self):
         """Create file types statistics tab."""
-        self.types_tree = QTreeWidget()
-        self.types_tree.setHeaderLabels(["File Type", "Count", "Size", "Percentage"])
+        self.types_model = FlatTableModel(
+            ("File Type", "Count", "Size", "Percentage"), self
+        )
+        self.types_tree = QTreeView()
+        self.types_tree.setModel(self.types_model)
+        self.types_tree.setRootIsDecorated(False)
         self.types_tree.setAlternatingRowColors(True)
         self.types_tree.setSortingEnabled(True)
-        
+
         # Configure column widths
         header = self.types_tree.header()
         header.resizeSection(0, 120)  # File Type
         header.resizeSection(1, 80)   # Count
         header.resizeSection(2, 100)  # Size
         header.resizeSection(3, 100)  # Percentage
-        
+
         self.tab_widget.addTab(self.types_tree, "File Types")
-        
+
     def _create_largest_tab(self):
         """Create largest items tab."""
-        self.largest_tree = QTreeWidget()
-        self.largest_tree.setHeaderLabels(["Name", "Size", "Type"])
+        self.largest_model = FlatTableModel(("Name", "Size", "Type"), self)
+        self.largest_tree = QTreeView()
+        self.largest_tree.setModel(self.largest_model)
+        self.largest_tree.setRootIsDecorated(False)
         self.largest_tree.setAlternatingRowColors(True)
         self.largest_tree.setSortingEnabled(True)
-        
+
         # Configure column widths
         header = self.largest_tree.header()
         header.resizeSection(0, 200)  # Name
         header.resizeSection(1, 100)  # Size
         header.resizeSection(2, 80)   # Type
-        
+
         self.tab_widget.addTab(self.largest_tree, "Largest Items")
         
     def update_stats(self, scan_data: FileInfo):
-        """Update statistics with new scan data."""
+        """Update statistics with new scan data.
+
+        Only the overview (the default tab) is filled eagerly; the types
+        and largest tabs are marked dirty and populated when first shown,
+        so their cost is never paid for tabs the user doesn't open.
+        """
+        self._scan_data = scan_data
+        self._types_dirty = True
+        self._largest_dirty = True
         self._update_overview_stats(scan_data)
-        self._update_file_types_stats(scan_data)
-        self._update_largest_items_stats(scan_data)
-        
+        self._refresh_current_tab()
+
+    def _on_tab_change(self, index: int):
+        """Populate a lazily-deferred tab on first activation."""
+        self._refresh_current_tab()
+
+    def _refresh_current_tab(self):
+        """Bring the currently visible tab up to date if it is stale."""
+        if self._scan_data is None:
+            return
+        index = self.tab_widget.currentIndex()
+        if index == 1 and self._types_dirty:
+            self._types_dirty = False
+            self._update_file_types_stats(self._scan_data)
+        elif index == 2 and self._largest_dirty:
+            self._largest_dirty = False
+            self._update_largest_items_stats(self._scan_data)
+
     def _update_overview_stats(self, scan_data: FileInfo):
         """Update overview statistics."""
-        # Calculate statistics
-        total_files = 0
-        total_folders = 0
-        file_sizes = []
-        largest_file = None
-        largest_folder = None
-        max_depth = 0
-        deepest_path = ""
-        
-        def collect_stats(info: FileInfo, depth: int = 0):
-            nonlocal total_files, total_folders, largest_file, largest_folder, max_depth, deepest_path
-            
-            if info.is_directory:
-                total_folders += 1
-                if largest_folder is None or info.size > largest_folder.size:
-                    largest_folder = info
-            else:
-                total_files += 1
-                file_sizes.append(info.size)
-                if largest_file is None or info.size > largest_file.size:
-                    largest_file = info
-                    
-            if depth > max_depth:
-                max_depth = depth
-                deepest_path = str(info.path)
-                
-            for child in info.children:
-                collect_stats(child, depth + 1)
-                
-        collect_stats(scan_data)
-        
+        stats = scan_data.scan_stats
+        if stats is not None:
+            # The scanner aggregated these while building the tree; no need
+            # to walk the whole FileInfo graph again.
+            total_files = stats.total_files
+            total_folders = stats.total_folders
+            sum_file_size = stats.sum_file_size
+            largest_file = stats.largest_file
+            largest_folder = stats.largest_folder
+            deepest_path = stats.deepest_path
+        else:
+            # Fallback for trees built without a scan (e.g. loaded
+            # fixtures): explicit-stack walk with scalar locals — no frame
+            # per node and no recursion limit on deep trees.
+            total_files = 0
+            total_folders = 0
+            sum_file_size = 0
+            largest_file = None
+            largest_file_size = -1
+            largest_folder = None
+            largest_folder_size = -1
+            max_depth = 0
+            deepest_path = ""
+
+            stack = [(scan_data, 0)]
+            pop = stack.pop
+            extend = stack.extend
+            while stack:
+                info, depth = pop()
+                size = info.size
+
+                if info.is_directory:
+                    total_folders += 1
+                    if size > largest_folder_size:
+                        largest_folder_size = size
+                        largest_folder = info
+                else:
+                    total_files += 1
+                    sum_file_size += size
+                    if size > largest_file_size:
+                        largest_file_size = size
+                        largest_file = info
+
+                if depth > max_depth:
+                    max_depth = depth
+                    deepest_path = str(info.path)
+
+                children = info.children
+                if children:
+                    child_depth = depth + 1
+                    extend((child, child_depth) for child in children)
+
         # Update labels
         self.stats_labels["total_size"].setText(DiskAnalyzer.format_size(scan_data.size))
         self.stats_labels["total_files"].setText(f"{total_files:,}")
         self.stats_labels["total_folders"].setText(f"{total_folders:,}")
-        
-        avg_size = sum(file_sizes) / len(file_sizes) if file_sizes else 0
+
+        avg_size = sum_file_size / total_files if total_files else 0
         self.stats_labels["avg_file_size"].setText(DiskAnalyzer.format_size(int(avg_size)))
         
         if largest_file:
@@ -223,47 +332,41 @@ class StatsWidget(QWidget):
         
     def _update_file_types_stats(self, scan_data: FileInfo):
         """Update file types statistics."""
-        # Clear existing items
-        self.types_tree.clear()
-        
         # Get file type statistics
         type_stats = DiskAnalyzer.get_file_type_stats(scan_data)
         total_size = scan_data.size
-        
-        # Insert items
+
+        cells = []
+        keys = []
         for ext, data in type_stats.items():
             percentage = (data["size"] / total_size * 100) if total_size > 0 else 0
-            item = NumericTreeWidgetItem([
+            cells.append((
                 ext,
                 f"{data['count']:,}",
                 DiskAnalyzer.format_size(data["size"]),
                 f"{percentage:.1f}%"
-            ])
-            # Set sorting data for proper numeric sorting
-            item.setData(1, Qt.ItemDataRole.UserRole, data['count'])  # Count column
-            item.setData(2, Qt.ItemDataRole.UserRole, data["size"])   # Size column
-            item.setData(3, Qt.ItemDataRole.UserRole, percentage)     # Percentage column
-            self.types_tree.addTopLevelItem(item)
-            
+            ))
+            keys.append((ext, data['count'], data["size"], percentage))
+
+        self.types_model.set_rows(cells, keys)
+
     def _update_largest_items_stats(self, scan_data: FileInfo):
         """Update largest items statistics."""
-        # Clear existing items
-        self.largest_tree.clear()
-        
         # Get largest items
         largest_items = DiskAnalyzer.get_largest_items(scan_data, 50)
-        
-        # Insert items
+
+        cells = []
+        keys = []
         for item_info in largest_items:
             item_type = "Folder" if item_info.is_directory else "File"
-            item = NumericTreeWidgetItem([
+            cells.append((
                 item_info.name,
                 DiskAnalyzer.format_size(item_info.size),
                 item_type
-            ])
-            # Set sorting data for proper numeric sorting
-            item.setData(1, Qt.ItemDataRole.UserRole, item_info.size)  # Size column
-            self.largest_tree.addTopLevelItem(item)
+            ))
+            keys.append((item_info.name, item_info.size, item_type))
+
+        self.largest_model.set_rows(cells, keys)
             
     def update_selection_stats(self, file_info: FileInfo):
         """Update statistics for a selected item."""
@@ -282,10 +385,14 @@ class StatsWidget(QWidget):
         
     def clear(self):
         """Clear all statistics."""
+        self._scan_data = None
+        self._types_dirty = False
+        self._largest_dirty = False
+
         # Clear overview
         for label in self.stats_labels.values():
             label.setText("")
-            
-        # Clear trees
-        self.types_tree.clear()
-        self.largest_tree.clear()
+
+        # Clear tables
+        self.types_model.set_rows([], [])
+        self.largest_model.set_rows([], [])
@@ -6,15 +6,25 @@ Tree view component for displaying file hierarchy using PySide6.
 import subprocess
 import os
 import shutil
-from typing import Optional, Dict
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Optional
 from pathlib import Path
 
+# sys.platform is a frozen string, so these are plain comparisons at
+# import time; os.uname() per call would be a syscall.
+_IS_WINDOWS = sys.platform == "win32"
+_IS_MACOS = sys.platform == "darwin"
+
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QTreeWidget, QTreeWidgetItem,
-    QHeaderView, QMenu, QMessageBox
+    QWidget, QVBoxLayout, QLabel, QTreeView,
+    QHeaderView, QMenu, QMessageBox, QFileIconProvider
+)
+from PySide6.QtCore import (
+    Qt, Signal, Slot, QAbstractItemModel, QModelIndex, QObject,
+    QPersistentModelIndex, QThread
 )
-from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QAction
 
 # Import for cross-platform recycle bin functionality
@@ -28,55 +38,312 @@ except ImportError:
 from ..core import FileInfo, DiskAnalyzer
 
 
-class NumericTreeWidgetItem(QTreeWidgetItem):
-    """QTreeWidgetItem with proper numeric sorting support."""
+class FileInfoModel(QAbstractItemModel):
+    """Read-only item model over a FileInfo tree.
 
-    def __lt__(self, other):
-        column = self.treeWidget().sortColumn()
-        try:
-            self_data = self.data(column, Qt.ItemDataRole.UserRole)
-            other_data = other.data(column, Qt.ItemDataRole.UserRole)
-            if self_data is not None and other_data is not None:
-                return self_data < other_data
-        except Exception:
-            pass
-        # Fallback: compare text directly, do NOT call base class (avoids recursion on macOS/PySide6)
-        self_text = self.text(column)
-        other_text = other.text(column)
-        return self_text < other_text
+    Indexes carry the FileInfo itself as their internal pointer, so the
+    view allocates no per-node items and data() reads straight from the
+    scan result. Parent links and row numbers, which FileInfo does not
+    store, are cached lazily as the view drills down from the root.
+
+    Population cost is O(visible): the view only asks for rows of expanded
+    branches, and hasChildren answers the expand-arrow question for
+    collapsed directories without enumerating their contents.
+    """
+
+    HEADERS = ("Name", "Size", "Items", "Type", "Path")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._root: Optional[FileInfo] = None
+        self._parent_of: Dict[int, Optional[FileInfo]] = {}
+        self._row_of: Dict[int, int] = {}
+        self._applied_sort: Optional[tuple] = None
+        # Two shared QIcons: a blit from the shared pixmap cache per row,
+        # instead of shaping an emoji through fallback fonts on every paint.
+        provider = QFileIconProvider()
+        self._folder_icon = provider.icon(QFileIconProvider.IconType.Folder)
+        self._file_icon = provider.icon(QFileIconProvider.IconType.File)
+
+    def set_root(self, root_info: Optional[FileInfo]):
+        """Swap in a new scan result with a single model reset."""
+        self.beginResetModel()
+        self._root = root_info
+        self._applied_sort = None
+        self._parent_of.clear()
+        self._row_of.clear()
+        if root_info is not None:
+            self._parent_of[id(root_info)] = None
+            self._row_of[id(root_info)] = 0
+        self.endResetModel()
+
+    def file_info(self, index: QModelIndex) -> Optional[FileInfo]:
+        """Return the FileInfo behind an index."""
+        return index.internalPointer() if index.isValid() else None
+
+    def index(self, row, column, parent=QModelIndex()):
+        if (self._root is None or row < 0 or column < 0
+                or column >= len(self.HEADERS)):
+            return QModelIndex()
+        if not parent.isValid():
+            if row != 0:
+                return QModelIndex()
+            return self.createIndex(row, column, self._root)
+        parent_info = parent.internalPointer()
+        children = parent_info.children
+        if not children or row >= len(children):
+            return QModelIndex()
+        child = children[row]
+        child_id = id(child)
+        if child_id not in self._parent_of:
+            self._parent_of[child_id] = parent_info
+            self._row_of[child_id] = row
+        return self.createIndex(row, column, child)
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        parent_info = self._parent_of.get(id(index.internalPointer()))
+        if parent_info is None:
+            return QModelIndex()
+        return self.createIndex(self._row_of[id(parent_info)], 0, parent_info)
+
+    def rowCount(self, parent=QModelIndex()):
+        if self._root is None:
+            return 0
+        if not parent.isValid():
+            return 1
+        if parent.column() != 0:
+            return 0
+        children = parent.internalPointer().children
+        return len(children) if children else 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def hasChildren(self, parent=QModelIndex()):
+        if self._root is None:
+            return False
+        if not parent.isValid():
+            return True
+        return bool(parent.internalPointer().children)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DecorationRole:
+            if index.column() != 0:
+                return None
+            info = index.internalPointer()
+            return self._folder_icon if info.is_directory else self._file_icon
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        info = index.internalPointer()
+        column = index.column()
+        if column == 0:
+            return info.name
+        if column == 1:
+            return DiskAnalyzer.format_size(info.size)
+        if column == 2:
+            return f"{len(info.children)} items" if info.is_directory else ""
+        if column == 3:
+            if info.is_directory:
+                return "Folder"
+            return f"{info.extension.upper()} File" if info.extension else "File"
+        return str(info.path)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (role == Qt.ItemDataRole.DisplayRole
+                and orientation == Qt.Orientation.Horizontal):
+            return self.HEADERS[section]
+        return None
+
+    # Per-column sort keys; numeric columns compare the raw values, not
+    # their display strings.
+    _SORT_KEYS = (
+        lambda info: info.name.lower(),
+        lambda info: info.size,
+        lambda info: len(info.children) if info.is_directory else 0,
+        lambda info: "Folder" if info.is_directory else (info.extension or ""),
+        lambda info: str(info.path),
+    )
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Sort every children list in place as one layout change.
+
+        A model reset here would invalidate every persistent index, so the
+        view would collapse the expanded tree and drop the selection on
+        each header click. A layout change with remapped persistent
+        indexes keeps both.
+        """
+        if self._root is None or self._applied_sort == (column, order):
+            return
+        self._applied_sort = (column, order)
+        key = self._SORT_KEYS[column]
+        reverse = order == Qt.SortOrder.DescendingOrder
+
+        self.layoutAboutToBeChanged.emit()
+        old_persistent = self.persistentIndexList()
+
+        row_of = self._row_of
+        stack = [self._root]
+        while stack:
+            children = stack.pop().children
+            if children:
+                children.sort(key=key, reverse=reverse)
+                # Refresh the cached rows of nodes the view has seen;
+                # parents are untouched by reordering siblings.
+                for row, child in enumerate(children):
+                    child_id = id(child)
+                    if child_id in row_of:
+                        row_of[child_id] = row
+                stack.extend(children)
+
+        new_persistent = [
+            self.createIndex(row_of[id(index.internalPointer())],
+                             index.column(), index.internalPointer())
+            if index.isValid() else index
+            for index in old_persistent
+        ]
+        self.changePersistentIndexList(old_persistent, new_persistent)
+        self.layoutChanged.emit()
+
+    def remove_node(self, index: QModelIndex):
+        """Detach the node at index from both the FileInfo tree and the model."""
+        info = index.internalPointer()
+        parent_info = self._parent_of.get(id(info))
+        if parent_info is None:
+            # Removing the root clears the whole model
+            self.set_root(None)
+            return
+        row = self._row_of[id(info)]
+        self.beginRemoveRows(self.parent(index), row, row)
+        del parent_info.children[row]
+        del self._parent_of[id(info)]
+        del self._row_of[id(info)]
+        # Rows of the following siblings shift down by one
+        for sibling in parent_info.children[row:]:
+            sibling_id = id(sibling)
+            if sibling_id in self._row_of:
+                self._row_of[sibling_id] -= 1
+        self.endRemoveRows()
+
+    def remove_nodes(self, indexes: list):
+        """Detach several nodes with a single model reset.
+
+        Per-node beginRemoveRows costs the view one layout pass each; for
+        bulk deletes one reset is cheaper than N row removals.
+        """
+        if len(indexes) == 1:
+            self.remove_node(indexes[0])
+            return
+        self.beginResetModel()
+        for index in indexes:
+            info = index.internalPointer()
+            parent_info = self._parent_of.get(id(info))
+            if parent_info is None:
+                # One of the removed nodes is the root
+                self._root = None
+                break
+            parent_info.children.remove(info)
+        self._parent_of.clear()
+        self._row_of.clear()
+        if self._root is not None:
+            self._parent_of[id(self._root)] = None
+            self._row_of[id(self._root)] = 0
+        self.endResetModel()
+
+
+class DeleteWorker(QObject):
+    """Deletes items off the UI thread.
+
+    rmtree/unlink/send2trash release the GIL inside their syscalls, so
+    running them on a worker thread keeps paint and input events flowing
+    during large deletions. The worker never touches the model; it reports
+    results back over queued signals and the view updates on the main
+    thread.
+    """
+
+    progress = Signal(int, str)     # items done, current name
+    finished = Signal(list, list)   # successes, failures
+
+    def __init__(self, items, use_recycle_bin: bool):
+        super().__init__()
+        self._items = items
+        self.use_recycle_bin = use_recycle_bin
+
+    @Slot()
+    def run(self):
+        successes = []  # (persistent_index, name)
+        failures = []   # (name, error message)
+
+        def delete_one(file_info):
+            # FileInfo.path is already a Path; no reparse needed
+            file_path = file_info.path
+            if self.use_recycle_bin and HAS_SEND2TRASH:
+                send2trash(str(file_path))
+            elif file_path.is_dir():
+                shutil.rmtree(file_path)
+            else:
+                file_path.unlink()
+
+        # Deletion is bandwidth-bound, not CPU-bound: the unlink syscalls
+        # release the GIL, so a small pool overlaps them and scales well
+        # on SSDs and network filesystems.
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = {
+                pool.submit(delete_one, file_info): (persistent_index, file_info)
+                for persistent_index, file_info in self._items
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                persistent_index, file_info = futures[future]
+                error = future.exception()
+                if error is None:
+                    successes.append((persistent_index, file_info.name))
+                else:
+                    failures.append((file_info.name, str(error)))
+                self.progress.emit(done, file_info.name)
+
+        self.finished.emit(successes, failures)
 
 
 class TreeViewWidget(QWidget):
 
     item_selected = Signal(object)  # FileInfo object
     selection_cleared = Signal()    # Emitted when no items are selected
-    
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.file_info_map: Dict[int, FileInfo] = {}  # Use item ID as key
+        self._delete_thread = None
+        self._delete_worker = None
         self._setup_ui()
-        
+
     def _setup_ui(self):
         """Setup tree view UI."""
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
         layout.setSpacing(5)
-        
+
         # Title
         title_label = QLabel("Folder Structure")
         title_label.setStyleSheet("font-size: 14px; font-weight: bold; margin-bottom: 10px;")
         layout.addWidget(title_label)
-        
-        # Tree widget
-        self.tree = QTreeWidget()
+
+        # Tree view over the FileInfo model
+        self.model = FileInfoModel(self)
+        self.tree = QTreeView()
+        self.tree.setModel(self.model)
         layout.addWidget(self.tree)
-        
+
         # Configure tree
-        self.tree.setHeaderLabels(["Name", "Size", "Items", "Type", "Path"])
+        # All rows are one line tall; telling the view so lets it compute
+        # layout arithmetically instead of measuring every row.
+        self.tree.setUniformRowHeights(True)
         self.tree.setAlternatingRowColors(True)
         self.tree.setSortingEnabled(True)
-        self.tree.setSelectionMode(QTreeWidget.SelectionMode.ExtendedSelection)  # Enable multiselect
-        
+        self.tree.sortByColumn(1, Qt.SortOrder.DescendingOrder)
+        self.tree.setSelectionMode(QTreeView.SelectionMode.ExtendedSelection)  # Enable multiselect
+
         # Configure column widths
         header = self.tree.header()
         header.resizeSection(0, 300)  # Name
@@ -86,20 +353,65 @@ class TreeViewWidget(QWidget):
         header.resizeSection(4, 400)  # Path
         header.setStretchLastSection(True)
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
-        
+
         # Connect signals
-        self.tree.itemSelectionChanged.connect(self._on_selection_changed)
-        self.tree.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self.tree.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        self.tree.doubleClicked.connect(self._on_item_double_clicked)
         self.tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.tree.customContextMenuRequested.connect(self._show_context_menu)
-        
+
+        self._build_context_menu()
+
+    def _build_context_menu(self):
+        """Build the context menu once; showing it only tweaks text/visibility.
+
+        Each QAction is a QObject with signals, so rebuilding the menu per
+        right-click allocated and destroyed half a dozen of them every time.
+        """
+        self._context_menu = QMenu(self)
+
+        self._expand_all_action = QAction("Expand All", self)
+        self._expand_all_action.setStatusTip("")  # Clear status tip to prevent clearing status bar
+        self._expand_all_action.triggered.connect(self._expand_all)
+        self._context_menu.addAction(self._expand_all_action)
+
+        self._collapse_all_action = QAction("Collapse All", self)
+        self._collapse_all_action.setStatusTip("")  # Clear status tip to prevent clearing status bar
+        self._collapse_all_action.triggered.connect(self._collapse_all)
+        self._context_menu.addAction(self._collapse_all_action)
+
+        self._context_menu.addSeparator()
+
+        self._show_explorer_action = QAction("Show in Explorer", self)
+        self._show_explorer_action.setStatusTip("")  # Clear status tip to prevent clearing status bar
+        self._show_explorer_action.triggered.connect(self._show_selected_in_explorer)
+        self._context_menu.addAction(self._show_explorer_action)
+
+        self._explorer_separator = self._context_menu.addSeparator()
+
+        self._recycle_action = QAction("Send to Recycle Bin", self)
+        self._recycle_action.setStatusTip("")  # Clear status tip to prevent clearing status bar
+        self._recycle_action.triggered.connect(
+            lambda: self._delete_selected(use_recycle_bin=True))
+        self._context_menu.addAction(self._recycle_action)
+
+        self._delete_action = QAction("Delete Permanently", self)
+        self._delete_action.setStatusTip("")  # Clear status tip to prevent clearing status bar
+        self._delete_action.triggered.connect(
+            lambda: self._delete_selected(use_recycle_bin=False))
+        self._context_menu.addAction(self._delete_action)
+
     def _is_file_locked(self, file_path: Path) -> bool:
         """Check if a file is locked by another process."""
         if not file_path.exists():
             return False
-            
+
         if file_path.is_dir():
-            # For directories, try to create and remove a temporary file inside
+            # Cheap first pass: a writable directory is almost never locked.
+            # Only unwritable ones get the touch+unlink probe (two syscalls
+            # and a directory mtime update).
+            if os.access(str(file_path), os.W_OK):
+                return False
             try:
                 temp_file = file_path / '.temp_lock_check'
                 temp_file.touch()
@@ -108,6 +420,9 @@ class TreeViewWidget(QWidget):
             except (OSError, PermissionError):
                 return True
         else:
+            # Writable regular files skip the open probe entirely
+            if os.access(str(file_path), os.W_OK):
+                return False
             # For files, try to open in exclusive mode
             try:
                 with open(file_path, 'r+b') as f:
@@ -115,231 +430,110 @@ class TreeViewWidget(QWidget):
                 return False
             except (OSError, PermissionError):
                 return True
-        
+
     def _on_selection_changed(self):
         """Handle tree item selection."""
-        current_item = self.tree.currentItem()
-        if current_item:
-            item_id = id(current_item)
-            if item_id in self.file_info_map:
-                file_info = self.file_info_map[item_id]
-                self.item_selected.emit(file_info)
+        current_index = self.tree.currentIndex()
+        file_info = self.model.file_info(current_index)
+        if file_info is not None:
+            self.item_selected.emit(file_info)
         else:
             # No item selected - emit clear signal
             self.selection_cleared.emit()
-            
-    def _on_item_double_clicked(self, item: QTreeWidgetItem, column: int):
+
+    def _on_item_double_clicked(self, index: QModelIndex):
         """Handle double-click to expand/collapse."""
-        item.setExpanded(not item.isExpanded())
-        
+        self.tree.setExpanded(index, not self.tree.isExpanded(index))
+
     def _show_context_menu(self, position):
-        """Show context menu."""
-        item = self.tree.itemAt(position)
-        if not item:
+        """Show the cached context menu, adjusted to the current selection."""
+        index = self.tree.indexAt(position)
+        if not index.isValid():
             return
-            
-        menu = QMenu(self)
-        selected_items = self.tree.selectedItems()
-        
-        # Expand/Collapse actions
-        expand_all_action = QAction("Expand All", self)
-        expand_all_action.setStatusTip("")  # Clear status tip to prevent clearing status bar
-        expand_all_action.triggered.connect(self._expand_all)
-        menu.addAction(expand_all_action)
-        
-        collapse_all_action = QAction("Collapse All", self)
-        collapse_all_action.setStatusTip("")  # Clear status tip to prevent clearing status bar
-        collapse_all_action.triggered.connect(self._collapse_all)
-        menu.addAction(collapse_all_action)
-        
-        menu.addSeparator()
-        
-        # Show in explorer action (only for single selection)
-        if len(selected_items) == 1:
-            item_id = id(selected_items[0])
-            if item_id in self.file_info_map:
-                show_explorer_action = QAction("Show in Explorer", self)
-                show_explorer_action.setStatusTip("")  # Clear status tip to prevent clearing status bar
-                show_explorer_action.triggered.connect(lambda: self._show_in_explorer(selected_items[0]))
-                menu.addAction(show_explorer_action)
-                
-                menu.addSeparator()
-        
-        # Delete/Recycle actions (for single or multiple selection)
-        if selected_items:
-            if len(selected_items) == 1:
-                # Single item
-                if HAS_SEND2TRASH:
-                    recycle_action = QAction("Send to Recycle Bin", self)
-                    recycle_action.setStatusTip("")  # Clear status tip to prevent clearing status bar
-                    recycle_action.triggered.connect(lambda: self._delete_items(selected_items, use_recycle_bin=True))
-                    menu.addAction(recycle_action)
-                
-                delete_action = QAction("Delete Permanently", self)
-                delete_action.setStatusTip("")  # Clear status tip to prevent clearing status bar
-                delete_action.triggered.connect(lambda: self._delete_items(selected_items, use_recycle_bin=False))
-                menu.addAction(delete_action)
-            else:
-                # Multiple items
-                if HAS_SEND2TRASH:
-                    recycle_action = QAction(f"Send {len(selected_items)} Items to Recycle Bin", self)
-                    recycle_action.setStatusTip("")  # Clear status tip to prevent clearing status bar
-                    recycle_action.triggered.connect(lambda: self._delete_items(selected_items, use_recycle_bin=True))
-                    menu.addAction(recycle_action)
-                
-                delete_action = QAction(f"Delete {len(selected_items)} Items Permanently", self)
-                delete_action.setStatusTip("")  # Clear status tip to prevent clearing status bar
-                delete_action.triggered.connect(lambda: self._delete_items(selected_items, use_recycle_bin=False))
-                menu.addAction(delete_action)
-        
-        menu.exec(self.tree.mapToGlobal(position))
-        
+
+        selected_indexes = self.tree.selectionModel().selectedRows()
+        count = len(selected_indexes)
+        single = count == 1
+
+        # Show in explorer only makes sense for a single item
+        self._show_explorer_action.setVisible(single)
+        self._explorer_separator.setVisible(single)
+
+        self._recycle_action.setVisible(count > 0 and HAS_SEND2TRASH)
+        self._delete_action.setVisible(count > 0)
+        if single:
+            self._recycle_action.setText("Send to Recycle Bin")
+            self._delete_action.setText("Delete Permanently")
+        elif count > 1:
+            self._recycle_action.setText(f"Send {count} Items to Recycle Bin")
+            self._delete_action.setText(f"Delete {count} Items Permanently")
+
+        self._context_menu.exec(self.tree.mapToGlobal(position))
+
+    def _show_selected_in_explorer(self):
+        """Show the single selected item in the file explorer."""
+        selected_indexes = self.tree.selectionModel().selectedRows()
+        if len(selected_indexes) == 1:
+            self._show_in_explorer(selected_indexes[0])
+
+    def _delete_selected(self, use_recycle_bin: bool):
+        """Delete or recycle the currently selected items."""
+        self._delete_items(self.tree.selectionModel().selectedRows(),
+                           use_recycle_bin=use_recycle_bin)
+
     def _expand_all(self):
         """Expand all tree items."""
         self.tree.expandAll()
-        
+
     def _collapse_all(self):
         """Collapse all tree items."""
         self.tree.collapseAll()
-        
-    def _show_in_explorer(self, item: QTreeWidgetItem):
+
+    def _show_in_explorer(self, index: QModelIndex):
         """Show selected item in file explorer."""
-        item_id = id(item)
-        if item_id not in self.file_info_map:
+        file_info = self.model.file_info(index)
+        if file_info is None:
             return
-            
-        file_info = self.file_info_map[item_id]
+
         try:
-            if os.name == 'nt':  # Windows
+            if _IS_WINDOWS:
                 subprocess.run(['explorer', '/select,', str(file_info.path)], check=False)
-            elif os.name == 'posix':  # macOS and Linux
-                if os.uname().sysname == 'Darwin':  # macOS
-                    subprocess.run(['open', '-R', str(file_info.path)], check=False)
-                else:  # Linux
-                    subprocess.run(['xdg-open', str(file_info.path.parent)], check=False)
+            elif _IS_MACOS:
+                subprocess.run(['open', '-R', str(file_info.path)], check=False)
+            else:  # Linux and other POSIX
+                subprocess.run(['xdg-open', str(file_info.path.parent)], check=False)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Could not open file explorer: {str(e)}")
-            
-    def _delete_item(self, item: QTreeWidgetItem, use_recycle_bin: bool = True):
-        """Delete or recycle the selected item."""
-        item_id = id(item)
-        if item_id not in self.file_info_map:
-            return
-            
-        file_info = self.file_info_map[item_id]
-        file_path = Path(file_info.path)
-        
-        # Check if file is locked
-        is_locked = self._is_file_locked(file_path)
-        
-        # Confirm deletion
-        if file_info.is_directory:
-            msg = f"Are you sure you want to delete the folder '{file_info.name}' and all its contents?"
-        else:
-            msg = f"Are you sure you want to delete the file '{file_info.name}'?"
-            
-        if use_recycle_bin and HAS_SEND2TRASH:
-            msg += "\n\nThis will send the item to the Recycle Bin."
-        else:
-            msg += "\n\nThis action cannot be undone - the item will be permanently deleted."
-            
-        if is_locked:
-            msg += "\n\nWarning: This file appears to be locked or in use by another application. Deletion will likely fail."
-            
-        reply = QMessageBox.question(
-            self, 
-            "Confirm Deletion", 
-            msg,
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
-        )
-        
-        if reply != QMessageBox.StandardButton.Yes:
-            return
-            
-        try:
-            if use_recycle_bin and HAS_SEND2TRASH:
-                # Use send2trash library for cross-platform recycle bin support
-                send2trash(str(file_path))
-                action_msg = "sent to Recycle Bin"
-            else:
-                # Permanent deletion
-                if file_path.is_dir():
-                    shutil.rmtree(file_path)
-                else:
-                    file_path.unlink()
-                action_msg = "permanently deleted"
-                
-            # Remove item from tree
-            parent = item.parent()
-            if parent:
-                parent.removeChild(item)
-            else:
-                # Root level item
-                index = self.tree.indexOfTopLevelItem(item)
-                if index >= 0:
-                    self.tree.takeTopLevelItem(index)
-                    
-            # Remove from file info map
-            del self.file_info_map[item_id]
-            
-            QMessageBox.information(
-                self, 
-                "Success", 
-                f"'{file_info.name}' has been {action_msg} successfully."
-            )
-            
-        except PermissionError:
-            QMessageBox.warning(
-                self, 
-                "Permission Denied", 
-                f"Cannot delete '{file_info.name}': File is in use by another application or you don't have permission to delete it."
-            )
-        except OSError as e:
-            if "being used by another process" in str(e).lower() or "access is denied" in str(e).lower():
-                QMessageBox.warning(
-                    self, 
-                    "File In Use", 
-                    f"Cannot delete '{file_info.name}': The file is currently being used by another application."
-                )
-            else:
-                QMessageBox.critical(
-                    self, 
-                    "Error", 
-                    f"Could not delete '{file_info.name}':\n{str(e)}"
-                )
-        except Exception as e:
-            QMessageBox.critical(
-                self, 
-                "Error", 
-                f"Could not delete '{file_info.name}':\n{str(e)}"
-            )
-            
-    def _delete_items(self, items: list[QTreeWidgetItem], use_recycle_bin: bool = True):
+
+    def _delete_items(self, indexes: list, use_recycle_bin: bool = True):
         """Delete or recycle multiple selected items."""
-        if not items:
+        if not indexes:
             return
-            
-        # Get file info for all items
+
+        # Persistent indexes survive row removals while we delete in a loop
         items_to_delete = []
-        for item in items:
-            item_id = id(item)
-            if item_id in self.file_info_map:
-                file_info = self.file_info_map[item_id]
-                items_to_delete.append((item, file_info))
-        
+        for index in indexes:
+            file_info = self.model.file_info(index)
+            if file_info is not None:
+                items_to_delete.append((QPersistentModelIndex(index), file_info))
+
         if not items_to_delete:
             return
-        
-        # Check for locked files
+
+        # Check for locked files; for very large selections skip the
+        # per-item probes and show a generic warning instead.
+        probe_locks = len(items_to_delete) <= 50
         locked_files = []
-        for item, file_info in items_to_delete:
-            if self._is_file_locked(Path(file_info.path)):
-                locked_files.append(file_info.name)
-        
+        if probe_locks:
+            locked_files = [
+                file_info.name
+                for _, file_info in items_to_delete
+                if self._is_file_locked(file_info.path)
+            ]
+
         # Confirm deletion
         if len(items_to_delete) == 1:
-            item, file_info = items_to_delete[0]
+            index, file_info = items_to_delete[0]
             if file_info.is_directory:
                 msg = f"Are you sure you want to delete the folder '{file_info.name}' and all its contents?"
             else:
@@ -347,80 +541,88 @@ class TreeViewWidget(QWidget):
         else:
             folders = sum(1 for _, fi in items_to_delete if fi.is_directory)
             files = len(items_to_delete) - folders
-            
+
             if folders > 0 and files > 0:
                 msg = f"Are you sure you want to delete {folders} folder(s) and {files} file(s)?"
             elif folders > 0:
                 msg = f"Are you sure you want to delete {folders} folder(s) and all their contents?"
             else:
                 msg = f"Are you sure you want to delete {files} file(s)?"
-            
+
         if use_recycle_bin and HAS_SEND2TRASH:
             msg += "\n\nThese items will be sent to the Recycle Bin."
         else:
             msg += "\n\nThis action cannot be undone - the items will be permanently deleted."
-            
-        if locked_files:
+
+        if not probe_locks:
+            msg += "\n\nNote: some items may be locked or in use; those deletions will fail."
+        elif locked_files:
             if len(locked_files) == 1:
                 msg += f"\n\nWarning: '{locked_files[0]}' appears to be locked or in use. Deletion may fail."
             else:
                 msg += f"\n\nWarning: {len(locked_files)} files appear to be locked or in use. Some deletions may fail."
-            
+
         reply = QMessageBox.question(
-            self, 
-            "Confirm Deletion", 
+            self,
+            "Confirm Deletion",
             msg,
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No
         )
-        
+
         if reply != QMessageBox.StandardButton.Yes:
             return
-        
-        # Delete items
+
+        # Run the deletions on a worker thread; the tree stays disabled
+        # (but responsive) until results come back.
+        self.tree.setEnabled(False)
+        self._delete_thread = QThread(self)
+        self._delete_worker = DeleteWorker(items_to_delete, use_recycle_bin)
+        self._delete_worker.moveToThread(self._delete_thread)
+        self._delete_thread.started.connect(self._delete_worker.run)
+        self._delete_worker.finished.connect(self._on_delete_finished)
+        self._delete_worker.finished.connect(self._delete_thread.quit)
+        self._delete_thread.finished.connect(self._delete_worker.deleteLater)
+        self._delete_thread.finished.connect(self._delete_thread.deleteLater)
+        self._delete_thread.start()
+
+    def _on_delete_finished(self, successes: list, failures: list):
+        """Apply delete results to the tree on the main thread."""
+        use_recycle_bin = self._delete_worker.use_recycle_bin
+        self._delete_worker = None
+        self._delete_thread = None
+        self.tree.setEnabled(True)
+
+        # Remove from the model (and the FileInfo tree behind it) in one
+        # batch, with repaints suppressed until the whole sweep is done.
         successful_deletions = []
-        failed_deletions = []
-        
-        for item, file_info in items_to_delete:
+        removable = []
+        for persistent_index, name in successes:
+            index = QModelIndex(persistent_index)
+            if index.isValid():
+                removable.append(index)
+            successful_deletions.append(name)
+        if removable:
+            self.tree.setUpdatesEnabled(False)
             try:
-                file_path = Path(file_info.path)
-                
-                if use_recycle_bin and HAS_SEND2TRASH:
-                    send2trash(str(file_path))
-                else:
-                    if file_path.is_dir():
-                        shutil.rmtree(file_path)
-                    else:
-                        file_path.unlink()
-                
-                # Remove from tree and file info map
-                parent = item.parent()
-                if parent:
-                    parent.removeChild(item)
-                else:
-                    index = self.tree.indexOfTopLevelItem(item)
-                    if index >= 0:
-                        self.tree.takeTopLevelItem(index)
-                
-                del self.file_info_map[id(item)]
-                successful_deletions.append(file_info.name)
-                
-            except Exception as e:
-                failed_deletions.append((file_info.name, str(e)))
-        
+                self.model.remove_nodes(removable)
+            finally:
+                self.tree.setUpdatesEnabled(True)
+        failed_deletions = failures
+
         # Show results
         if successful_deletions and not failed_deletions:
             action_msg = "sent to Recycle Bin" if (use_recycle_bin and HAS_SEND2TRASH) else "permanently deleted"
             if len(successful_deletions) == 1:
                 QMessageBox.information(
-                    self, 
-                    "Success", 
+                    self,
+                    "Success",
                     f"'{successful_deletions[0]}' has been {action_msg} successfully."
                 )
             else:
                 QMessageBox.information(
-                    self, 
-                    "Success", 
+                    self,
+                    "Success",
                     f"{len(successful_deletions)} items have been {action_msg} successfully."
                 )
         elif successful_deletions and failed_deletions:
@@ -431,14 +633,14 @@ class TreeViewWidget(QWidget):
                 msg += f"• {name}: {error[:50]}...\n"
             if len(failed_deletions) > 5:
                 msg += f"... and {len(failed_deletions) - 5} more"
-            
+
             QMessageBox.warning(self, "Partial Success", msg)
         else:
             # All deletions failed
             if len(failed_deletions) == 1:
                 QMessageBox.critical(
-                    self, 
-                    "Error", 
+                    self,
+                    "Error",
                     f"Could not delete '{failed_deletions[0][0]}':\n{failed_deletions[0][1]}"
                 )
             else:
@@ -446,72 +648,29 @@ class TreeViewWidget(QWidget):
                 for name, error in failed_deletions[:3]:
                     msg += f"• {name}: {error[:50]}...\n"
                 QMessageBox.critical(self, "Error", msg)
-            
+
     def populate_tree(self, root_info: FileInfo):
         """Populate tree with file information."""
-        self.clear()
-        
-        # Create root item
-        root_item = self._create_tree_item(None, root_info)
-        self.tree.addTopLevelItem(root_item)
-        
-        # Expand root by default
-        root_item.setExpanded(True)
-        
-        # Auto-expand first level if not too many items
-        if len(root_info.children) <= 20:
-            for i in range(root_item.childCount()):
-                child = root_item.child(i)
-                child.setExpanded(True)
-                
-    def _create_tree_item(self, parent_item: Optional[QTreeWidgetItem], file_info: FileInfo) -> QTreeWidgetItem:
-        """Create a tree item for the given file info."""
-        # Determine display values
-        name = file_info.name
-        size_str = DiskAnalyzer.format_size(file_info.size)
-        
-        if file_info.is_directory:
-            items_count = len(file_info.children)
-            items_str = f"{items_count} items"
-            type_str = "Folder"
-            icon = "📁"
-        else:
-            items_str = ""
-            if file_info.extension:
-                type_str = f"{file_info.extension.upper()} File"
-            else:
-                type_str = "File"
-            icon = "📄"
-        
-        # Create item
-        display_name = f"{icon} {name}"
-        path_str = str(file_info.path)
-        item = NumericTreeWidgetItem([display_name, size_str, items_str, type_str, path_str])
-        
-        # Set sorting data for proper numeric sorting
-        item.setData(1, Qt.ItemDataRole.UserRole, file_info.size)  # Size column - use raw bytes for sorting
-        if file_info.is_directory:
-            item.setData(2, Qt.ItemDataRole.UserRole, len(file_info.children))  # Items column - use count for sorting
-        else:
-            item.setData(2, Qt.ItemDataRole.UserRole, 0)  # Files have 0 items
-        
-        # Store file info mapping using item's memory id
-        self.file_info_map[id(item)] = file_info
-        
-        # Add children (sorted by size, largest first)
-        sorted_children = sorted(
-            file_info.children,
-            key=lambda x: x.size,
-            reverse=True
-        )
-        
-        for child in sorted_children:
-            child_item = self._create_tree_item(item, child)
-            item.addChild(child_item)
-            
-        return item
-        
+        # Suppress repaints until the reset, sort, and expands are done
+        self.tree.setUpdatesEnabled(False)
+        try:
+            self.model.set_root(root_info)
+
+            # Re-apply the current sort order to the new tree
+            header = self.tree.header()
+            self.model.sort(header.sortIndicatorSection(), header.sortIndicatorOrder())
+
+            # Expand root by default
+            root_index = self.model.index(0, 0)
+            self.tree.expand(root_index)
+
+            # Auto-expand first level if not too many items
+            if len(root_info.children) <= 20:
+                for row in range(self.model.rowCount(root_index)):
+                    self.tree.expand(self.model.index(row, 0, root_index))
+        finally:
+            self.tree.setUpdatesEnabled(True)
+
     def clear(self):
         """Clear the tree view."""
-        self.tree.clear()
-        self.file_info_map.clear()
+        self.model.set_root(None)
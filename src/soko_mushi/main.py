@@ -5,17 +5,11 @@ Main entry point for Soko-Mushi disk analysis tool.
 
 import sys
 import os
-from pathlib import Path
 from typing import Optional
 
 if sys.platform.startswith("linux"):
     os.environ["QT_QPA_PLATFORM"] = "xcb"
 
-# Add src to path for development
-src_path = Path(__file__).parent.parent.parent / "src"
-if src_path.exists():
-    sys.path.insert(0, str(src_path))
-
 from soko_mushi.gui.main_window import run_app
 
 
@@ -2,9 +2,10 @@
 Unit tests for Soko-Mushi core functionality.
 """
 
+import csv
+import json
+
 import pytest
-import tempfile
-import os
 from pathlib import Path
 
 from soko_mushi.core import DiskAnalyzer, FileInfo, ReportExporter
@@ -13,22 +14,24 @@ from soko_mushi.core import DiskAnalyzer, FileInfo, ReportExporter
 class TestDiskAnalyzer:
     """Test cases for DiskAnalyzer class."""
     
-    def test_format_size(self):
+    @pytest.mark.parametrize("size,expected", [
+        (0, "0 B"),
+        (512, "512 B"),
+        (1024, "1.0 KB"),
+        (1024 * 1024, "1.0 MB"),
+        (1024 * 1024 * 1024, "1.0 GB"),
+    ])
+    def test_format_size(self, size, expected):
         """Test file size formatting."""
-        assert DiskAnalyzer.format_size(0) == "0 B"
-        assert DiskAnalyzer.format_size(1024) == "1.0 KB"
-        assert DiskAnalyzer.format_size(1024 * 1024) == "1.0 MB"
-        assert DiskAnalyzer.format_size(1024 * 1024 * 1024) == "1.0 GB"
-        assert DiskAnalyzer.format_size(512) == "512 B"
+        assert DiskAnalyzer.format_size(size) == expected
         
-    def test_get_available_drives(self):
+    def test_get_available_drives(self, available_drives):
         """Test drive detection."""
-        drives = DiskAnalyzer.get_available_drives()
-        assert isinstance(drives, list)
-        assert len(drives) > 0
+        assert isinstance(available_drives, list)
+        assert len(available_drives) > 0
         
     def test_file_info_creation(self):
-        """Test FileInfo dataclass."""
+        """Test FileInfo creation."""
         file_info = FileInfo(
             path=Path("/test/path"),
             name="test.txt",
@@ -37,88 +40,107 @@ class TestDiskAnalyzer:
             extension=".txt",
             modified_time=1234567890.0
         )
-        
+
         assert file_info.name == "test.txt"
         assert file_info.size == 1024
         assert not file_info.is_directory
         assert file_info.extension == ".txt"
-        assert len(file_info.children) == 0
+        assert not file_info.children  # files carry no children list
 
+    def test_fileinfo_slots(self):
+        """FileInfo instances carry no __dict__.
 
-class TestReportExporter:
-    """Test cases for ReportExporter class."""
-    
-    def create_test_file_info(self):
-        """Create test file info structure."""
-        root = FileInfo(
-            path=Path("/test"),
-            name="test",
-            size=2048,
-            is_directory=True,
-            extension="",
-            modified_time=1234567890.0
-        )
-        
-        file1 = FileInfo(
-            path=Path("/test/file1.txt"),
-            name="file1.txt",
+        Scans allocate one FileInfo per node, so the slotted fixed layout
+        is what keeps large trees affordable; lock it in.
+        """
+        file_info = FileInfo(
+            path=Path("/test/path"),
+            name="test.txt",
             size=1024,
             is_directory=False,
             extension=".txt",
             modified_time=1234567890.0
         )
-        
-        file2 = FileInfo(
-            path=Path("/test/file2.py"),
-            name="file2.py",
-            size=1024,
-            is_directory=False,
-            extension=".py",
-            modified_time=1234567890.0
-        )
-        
-        root.children = [file1, file2]
-        return root
-        
-    def test_export_to_json(self):
+
+        assert not hasattr(file_info, "__dict__")
+        with pytest.raises(AttributeError):
+            file_info.unexpected_attribute = 1
+
+
+@pytest.fixture(scope="session")
+def export_dir(tmp_path_factory):
+    """One shared output directory for all export tests.
+
+    tmp_path creates (and later removes) a fresh directory per test;
+    sharing a single session directory cuts that to one mkdir, with
+    pytest still cleaning up at session end.
+    """
+    return tmp_path_factory.mktemp("exports")
+
+
+@pytest.fixture(scope="module")
+def sample_tree():
+    """A small FileInfo tree, built once and shared read-only."""
+    root = FileInfo(
+        path=Path("/test"),
+        name="test",
+        size=2048,
+        is_directory=True,
+        extension="",
+        modified_time=1234567890.0
+    )
+
+    file1 = FileInfo(
+        path=Path("/test/file1.txt"),
+        name="file1.txt",
+        size=1024,
+        is_directory=False,
+        extension=".txt",
+        modified_time=1234567890.0
+    )
+
+    file2 = FileInfo(
+        path=Path("/test/file2.py"),
+        name="file2.py",
+        size=1024,
+        is_directory=False,
+        extension=".py",
+        modified_time=1234567890.0
+    )
+
+    root.children = [file1, file2]
+    return root
+
+
+class TestReportExporter:
+    """Test cases for ReportExporter class."""
+
+    def test_export_to_json(self, sample_tree, export_dir):
         """Test JSON export functionality."""
-        root_info = self.create_test_file_info()
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            temp_path = f.name
-            
-        try:
-            ReportExporter.export_to_json(root_info, temp_path)
-            assert os.path.exists(temp_path)
-            
-            # Verify file has content
-            with open(temp_path, 'r') as f:
-                content = f.read()
-                assert len(content) > 0
-                assert "scan_timestamp" in content
-                assert "file_tree" in content
-                
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-                
-    def test_export_to_csv(self):
+        temp_path = export_dir / "report.json"
+
+        ReportExporter.export_to_json(sample_tree, str(temp_path))
+        assert temp_path.exists()
+
+        # Parse and probe keys rather than substring-scanning the whole
+        # serialized tree; this also verifies the output is valid JSON.
+        with open(temp_path, 'r') as f:
+            data = json.load(f)
+        assert {"scan_timestamp", "file_tree"} <= data.keys()
+        assert len(data["file_tree"]["children"]) == 2
+
+    def test_export_to_csv(self, sample_tree, export_dir):
         """Test CSV export functionality."""
-        root_info = self.create_test_file_info()
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            temp_path = f.name
-            
-        try:
-            ReportExporter.export_to_csv(root_info, temp_path)
-            assert os.path.exists(temp_path)
-            
-            # Verify file has content
-            with open(temp_path, 'r') as f:
-                lines = f.readlines()
-                assert len(lines) > 1  # Header + at least one data row
-                assert "path" in lines[0]  # Header should contain 'path'
-                
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        temp_path = export_dir / "report.csv"
+
+        ReportExporter.export_to_csv(sample_tree, str(temp_path))
+        assert temp_path.exists()
+
+        # Read only the header and the first data row; no need to pull the
+        # whole file into memory to know the export worked.
+        with open(temp_path, newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            first_row = next(reader, None)
+        assert "path" in header
+        assert first_row is not None